@@ -0,0 +1,188 @@
+#! /usr/bin/env python3
+"""
+Mesures de performance de conjugue_moi sur la liste de verbes fournie (verbes_hunspell.list).
+
+Mesure le débit de chaque temps (verbes/s et formes/s), le temps d'import du module, la durée de la
+génération complète du dictionnaire en ligne de commande, la latence d'un tableau de conjugaison
+demandé à un coprocessus `--stream` ou à un processus lancé pour lui, et la mémoire maximale utilisée.
+Les résultats sont écrits en JSON. Avec --compare, le script échoue si une mesure se dégrade de plus
+du seuil donné par rapport à une référence enregistrée.
+
+    python3 benchmark.py --output bench.json
+    python3 benchmark.py --compare bench.json --threshold 0.15
+"""
+
+import argparse
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import time
+
+import conjugue_moi
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SCRIPT = os.path.join(HERE, "conjugue_moi.py")
+
+
+def bench_tenses(verbs, repeat):
+    """Débit de chaque temps : meilleur de `repeat` passages sur toute la liste de verbes"""
+    results = {}
+
+    for tense in conjugue_moi.TENSES.values():
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            forms = 0
+            for verb in verbs:
+                for _ in conjugue_moi.dictionary_forms(verb, (tense,)):
+                    forms += 1
+            timings.append(time.perf_counter() - start)
+
+        best = min(timings)
+        results[tense.__name__] = {"verbs_per_s": len(verbs) / best,
+                                   "forms_per_s": forms / best}
+
+    return results
+
+
+def bench_import(repeat):
+    """Temps d'import du module dans un nouvel interpréteur (médiane, en secondes)"""
+    code = "import time; t = time.perf_counter(); import conjugue_moi; print(time.perf_counter() - t)"
+    timings = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", code], cwd=HERE, check=True,
+                                capture_output=True, text=True).stdout
+        timings.append(float(output))
+    return statistics.median(timings)
+
+
+def bench_cli(verbs_path, repeat):
+    """
+    Durée de la génération du dictionnaire en ligne de commande (médiane, en secondes) et
+    mémoire résidente maximale du processus (en Kio).
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, SCRIPT, verbs_path, "--output", os.devnull], check=True)
+        timings.append(time.perf_counter() - start)
+
+    # ru_maxrss est le maximum sur tous les processus fils terminés : la génération du dictionnaire
+    # consomme bien plus que les imports mesurés par ailleurs
+    peak_rss = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return statistics.median(timings), peak_rss
+
+
+def bench_stream(verbs, count=50):
+    """
+    Latence par verbe (médiane, en millisecondes) d'un tableau de conjugaison demandé à un
+    coprocessus `--stream` déjà lancé, comparée au lancement d'un processus par verbe.
+    """
+    verbs = verbs[:count]
+
+    process = subprocess.Popen([sys.executable, SCRIPT, "--stream"], cwd=HERE, text=True,
+                               stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+    stream = []
+    try:
+        for verb in verbs:
+            start = time.perf_counter()
+            process.stdin.write(verb + "\n")
+            process.stdin.flush()
+            # La réponse se termine par une ligne vide ; "" signifie que le coprocessus s'est arrêté
+            while (line := process.stdout.readline()) != "\n":
+                if not line:
+                    raise RuntimeError(f"le coprocessus --stream s'est arrêté (code {process.wait()})")
+            stream.append(time.perf_counter() - start)
+    finally:
+        process.stdin.close()
+        process.wait()
+
+    spawn = []
+    for verb in verbs:
+        start = time.perf_counter()
+        subprocess.run([sys.executable, SCRIPT, verb], cwd=HERE, check=True, stdout=subprocess.DEVNULL)
+        spawn.append(time.perf_counter() - start)
+
+    return {"stream_ms_per_verb": statistics.median(stream) * 1000,
+            "spawn_ms_per_verb": statistics.median(spawn) * 1000}
+
+
+def run(verbs_path, repeat, limit=None):
+    verbs = list(conjugue_moi.read_verbs(verbs_path))[:limit]
+    cli_seconds, peak_rss = bench_cli(verbs_path, repeat)
+
+    return {"python": sys.version.split()[0],
+            "verbs": len(verbs),
+            "tenses": bench_tenses(verbs, repeat),
+            "import_seconds": bench_import(max(repeat, 5)),
+            "cli_seconds": cli_seconds,
+            "table": bench_stream(verbs),
+            "peak_rss_kib": peak_rss}
+
+
+def _flatten(results, prefix=""):
+    """Aplatit les mesures numériques en {"tenses.IndicatifPresent.verbs_per_s": ...}"""
+    flat = {}
+    for key, value in results.items():
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{prefix}{key}."))
+        elif isinstance(value, (int, float)) and key != "verbs":
+            flat[prefix + key] = value
+    return flat
+
+
+def compare(results, baseline, threshold):
+    """
+    Compare les mesures à une référence. Les débits (*_per_s) doivent rester au-dessus de
+    (1 - seuil) fois la référence, les durées et la mémoire en dessous de (1 + seuil) fois.
+    Retourne la liste des régressions sous forme de messages.
+    """
+    current = _flatten(results)
+    regressions = []
+
+    for name, reference in _flatten(baseline).items():
+        if name not in current or not reference:
+            continue
+
+        ratio = current[name] / reference
+        if name.endswith("_per_s"):
+            regressed = ratio < 1 - threshold
+        else:
+            regressed = ratio > 1 + threshold
+
+        if regressed:
+            regressions.append(f"{name}: {reference:.6g} -> {current[name]:.6g} ({ratio - 1:+.1%})")
+
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mesures de performance de conjugue_moi")
+    parser.add_argument("--verbs", default=conjugue_moi.VERBS_PATH,
+                        help="liste de verbes à utiliser (défaut: verbes_hunspell.list)")
+    parser.add_argument("--repeat", type=int, default=3, help="nombre de répétitions de chaque mesure")
+    parser.add_argument("--limit", type=int, help="ne mesurer les temps que sur les N premiers verbes")
+    parser.add_argument("--output", help="fichier JSON où écrire les résultats (défaut: sortie standard)")
+    parser.add_argument("--compare", metavar="BASELINE", help="fichier JSON de référence à comparer")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="dégradation tolérée par rapport à la référence (défaut: 0.10)")
+    args = parser.parse_args()
+
+    results = run(args.verbs, args.repeat, args.limit)
+
+    text = json.dumps(results, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w") as fh:
+            fh.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare) as fh:
+            regressions = compare(results, json.load(fh), args.threshold)
+        for regression in regressions:
+            print(f"Régression {regression}", file=sys.stderr)
+        sys.exit(1 if regressions else 0)
@@ -1,12 +1,267 @@
 #! /usr/bin/env python3
 
-import re
+import heapq
+import mmap
+import os
+import sys
+import zlib
+from array import array
+from collections import OrderedDict, deque
+from collections.abc import Mapping
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import islice
+from time import perf_counter
+
+
+# Liste de verbes fournie avec le module et index des formes conjuguées construit à partir d'elle
+VERBS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "verbes_hunspell.list")
+FORM_INDEX_PATH = os.path.splitext(os.path.abspath(__file__))[0] + ".index"
+COMPLETION_INDEX_PATH = os.path.splitext(os.path.abspath(__file__))[0] + ".completion"
+CONJUGATION_STORE_PATH = os.path.splitext(os.path.abspath(__file__))[0] + ".store"
+
+
+def _file_crc(path):
+    with open(path, "rb") as fh:
+        return f"{zlib.crc32(fh.read()):08x}"
+
+
+def _source_fingerprint():
+    """Empreinte du code source du module et de la version de Python"""
+    # sys.version peut contenir des retours à la ligne, séparateurs des en-têtes des index
+    return f"{_file_crc(os.path.abspath(__file__))}-{zlib.crc32(sys.version.encode()):08x}"
+
+
+class Instrumentation:
+    """
+    Statistiques de conjugaison : appels et temps cumulé par temps, terminaisons utilisées, verbes
+    sans terminaison correspondante et personnes sans forme (verbes défectifs).
+
+    Désactivée par défaut : les chemins de conjugaison ne testent alors qu'une variable globale.
+    """
+
+    def __init__(self):
+        self.tenses = {}
+        self.classify_calls = 0
+        self.classify_seconds = 0.0
+
+    def record(self, tense, suffix, seconds):
+        """Enregistre une conjugaison de `tense` ayant retenu la terminaison `suffix`"""
+        entry = self.tenses.get(tense.__name__)
+        if entry is None:
+            entry = self.tenses[tense.__name__] = {"calls": 0, "seconds": 0.0, "unmatched": 0,
+                                                   "defective_slots": 0, "suffixes": {}}
+
+        entry["calls"] += 1
+        entry["seconds"] += seconds
+        if suffix is None:
+            entry["unmatched"] += 1
+            entry["defective_slots"] += len(tense.PRONOUNS)
+        else:
+            entry["suffixes"][suffix] = entry["suffixes"].get(suffix, 0) + 1
+            entry["defective_slots"] += tense.terminations[suffix].count(None)
+
+    def record_classify(self, seconds):
+        self.classify_calls += 1
+        self.classify_seconds += seconds
+
+    def merge(self, report):
+        """Ajoute les statistiques d'un rapport (par exemple celui d'un processus fils)"""
+        self.classify_calls += report["classify"]["calls"]
+        self.classify_seconds += report["classify"]["seconds"]
+
+        for name, other in report["tenses"].items():
+            entry = self.tenses.setdefault(name, {"calls": 0, "seconds": 0.0, "unmatched": 0,
+                                                  "defective_slots": 0, "suffixes": {}})
+            for key in ("calls", "seconds", "unmatched", "defective_slots"):
+                entry[key] += other[key]
+            for suffix, hits in other["suffixes"].items():
+                entry["suffixes"][suffix] = entry["suffixes"].get(suffix, 0) + hits
+
+    def report(self):
+        """Retourne les statistiques sous forme sérialisable en JSON, terminaisons les plus utilisées en tête"""
+        tenses = {}
+        for name, entry in self.tenses.items():
+            suffixes = sorted(entry["suffixes"].items(), key=lambda item: (-item[1], item[0]))
+            tenses[name] = {**entry, "suffixes": dict(suffixes)}
+
+        return {"classify": {"calls": self.classify_calls, "seconds": self.classify_seconds},
+                "tenses": tenses}
+
+
+_instrumentation = None
+
+
+def enable_instrumentation():
+    """Active la collecte des statistiques et retourne l'objet `Instrumentation` qui les reçoit"""
+    global _instrumentation
+    _instrumentation = Instrumentation()
+    return _instrumentation
+
+
+def disable_instrumentation():
+    """Désactive la collecte et retourne les statistiques recueillies (None si elle était inactive)"""
+    global _instrumentation
+    stats, _instrumentation = _instrumentation, None
+    return stats
+
+
+class lazy_table:
+    """
+    Table de classe calculée au premier accès par `build(cls)`, puis remplacée par sa valeur.
+    Évite de construire à l'import les tables des temps qui ne serviront pas.
+    """
+
+    def __init__(self, build, name=None):
+        self.build = build
+        self.name = name
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        value = self.build(owner)
+        setattr(owner, self.name, value)
+        return value
+
+
+def _strip_ons(form):
+    """Radical d'une forme en '-ons' : "prenons" -> "pren" """
+    return form[:-3]
+
+
+class derived_table(lazy_table):
+    """
+    Table de terminaisons dérivée de celle d'un autre temps, construite au premier accès.
+
+    Pour chaque terminaison de la table `table` du temps `base` dont la personne `source` existe,
+    chaque élément de `endings` donne une forme : une chaîne est ajoutée au radical de la personne
+    `source` obtenu par `stem`, un couple (personne, fin) prend le radical d'une autre personne,
+    et une fin peut être une fonction du radical. Une forme dont la personne d'origine n'existe pas
+    reste inexistante. Les entrées de `overrides` remplacent ensuite les terminaisons dérivées.
+
+    Une terminaison dont la personne `source` n'existe pas est omise, et le verbe se rabat alors sur
+    une terminaison plus courte ; avec `keep_missing`, elle est gardée avec des formes inexistantes
+    (le verbe défectif le reste dans le temps dérivé).
+    """
+
+    def __init__(self, base, endings, source="1pp", stem=_strip_ons, table="terminations",
+                 overrides=None, keep_missing=False, name=None):
+        super().__init__(self.derive, name)
+        self.base = base
+        self.endings = [entry if isinstance(entry, tuple) else (source, entry) for entry in endings]
+        self.source = source
+        self.stem = stem
+        self.table = table
+        self.overrides = overrides or {}
+        self.keep_missing = keep_missing
+
+    def derive(self, owner):
+        index = self.base._person_index
+        source = index[self.source]
+        endings = [(index[person], ending) for person, ending in self.endings]
+
+        result = {}
+        for term, conjug in getattr(self.base, self.table).items():
+            if conjug[source] is None and not self.keep_missing:
+                continue
+
+            terms = []
+            for person, ending in endings:
+                if conjug[person] is None:
+                    terms.append(None)
+                    continue
+                radical = self.stem(conjug[person])
+                terms.append(ending(radical) if callable(ending) else radical + ending)
+            result[term] = terms
+
+        result.update(self.overrides)
+        return result
+
+
+def _merged_groups(tense):
+    """Table complète d'un temps : réunion de ses tables de terminaisons par groupe"""
+    return {**tense.terminations_group1, **tense.terminations_group2, **tense.terminations_group3}
+
+
+class ConjugationTable(Mapping):
+    """
+    Résultat de la conjugaison d'un verbe à un temps.
+
+    Ne stocke qu'une forme (radical + terminaison) par personne. Se lit comme l'ancien
+    dictionnaire de dictionnaires {"1ps": {"je": "je mange"}, "3ps": {"il": ..., "elle": ...}} :
+    les formes avec pronom sont construites à la lecture. Le tableau n'est pas modifiable.
+    """
+    __slots__ = ("tense", "forms", "interrogative")
+
+    def __init__(self, tense, forms, interrogative=False):
+        # Les tableaux sont partagés par le cache : aucun attribut ne change après la construction
+        object.__setattr__(self, "tense", tense)
+        object.__setattr__(self, "forms", tuple(forms))
+        object.__setattr__(self, "interrogative", interrogative)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"ConjugationTable n'est pas modifiable ({name})")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"ConjugationTable n'est pas modifiable ({name})")
+
+    def __reduce__(self):
+        return ConjugationTable, (self.tense, self.forms, self.interrogative)
+
+    def form(self, person):
+        """Retourne la forme conjuguée seule (sans pronom) d'une personne, None si elle n'existe pas"""
+        return self.forms[self.tense._person_index[person]]
+
+    def __getitem__(self, person):
+        return _PersonForms(self, person, self.tense._person_index[person])
+
+    def __iter__(self):
+        return iter(self.tense.PRONOUNS)
+
+    def __len__(self):
+        return len(self.tense.PRONOUNS)
+
+    def __repr__(self):
+        return f"ConjugationTable({self.tense.__name__}, {self.forms!r}, interrogative={self.interrogative})"
+
+
+class _PersonForms(Mapping):
+    """Vue {pronom: forme avec pronom} d'une personne d'un `ConjugationTable`"""
+    __slots__ = ("_table", "_person", "_index")
+
+    def __init__(self, table, person, index):
+        self._table = table
+        self._person = person
+        self._index = index
+
+    def __getitem__(self, pronoun):
+        table = self._table
+        if pronoun not in table.tense.PRONOUNS[self._person]:
+            raise KeyError(pronoun)
+
+        form = table.forms[self._index]
+        if form is None:
+            return None
+        if table.interrogative:
+            return table.tense._get_interrogative_form(form, pronoun, self._person)
+        return table.tense._get_simple_form(form, pronoun, self._person)
+
+    def __iter__(self):
+        return iter(self._table.tense.PRONOUNS[self._person])
+
+    def __len__(self):
+        return len(self._table.tense.PRONOUNS[self._person])
 
 
 class Tense:
     """Classe générique d'un temps"""
     terminations = {}
 
+    # Clé marquant la fin d'une terminaison dans l'arbre des suffixes (jamais un caractère)
+    _TRIE_END = ""
+    _suffix_trie = {}
+
     PRONOUNS = {"1ps": ["je"],
                 "2ps": ["tu"],
                 "3ps": ["il", "elle", "on"],
@@ -14,41 +269,133 @@ class Tense:
                 "2pp": ["vous"],
                 "3pp": ["ils", "elles"]}
 
+    # Position de chaque personne dans les tables de terminaisons
+    _person_index = {person: i for i, person in enumerate(PRONOUNS)}
+
     @classmethod
     def conjugate(cls, verb, interrogative=True):
         """
         Conjugue n'importe quel verbe dans ce temps.
-        Retourne un dicitonnaire avec seulement le verbe conjugué
-        """
-
-        # Initialisation du résultat sous forme de dictionnaire de dictionnaire
-        # Le résultat est de type {"1ps": {"je": "je mange"}, "2ps": {"tu": "tu manges"}, ...}
-        result = dict()
-        for person, pronouns in cls.PRONOUNS.items():
-            result[person] = {}
-            for pronoun in pronouns:
-                result[person][pronoun] = None
-
-        # On trie les terminaisons par ordre décroissant de taille afin de matcher le plus
-        # précisement possible
-        for suffix in sorted(cls.terminations.keys(), key=lambda k: len(k), reverse=True):
-            if verb.endswith(suffix):
-                radical = verb[:-len(suffix)]
-
-                for person, term in zip(cls.PRONOUNS.keys(), cls.terminations[suffix]):
-                    if term is not None:
-                        for pronoun in cls.PRONOUNS[person]:
-                            if interrogative:
-                                result[person][pronoun] = cls._get_interrogative_form(radical + term, pronoun, person)
-                            else:
-                                result[person][pronoun] = cls._get_simple_form(radical + term, pronoun, person)
+        Retourne un `ConjugationTable`, lisible comme {"1ps": {"je": "je mange"}, ...}
+        """
+
+        stats = _instrumentation
+        if stats is not None:
+            start = perf_counter()
+
+        # On cherche la terminaison la plus longue afin de matcher le plus précisement possible
+        suffix = cls._match_suffix(verb)
+        if suffix is None:
+            table = ConjugationTable(cls, (None,) * len(cls.PRONOUNS), interrogative)
+        else:
+            table = ConjugationTable(cls, cls._forms(verb, suffix), interrogative)
+
+        if stats is not None:
+            stats.record(cls, suffix, perf_counter() - start)
+        return table
+
+    @classmethod
+    def _forms(cls, verb, suffix):
+        """Formes conjuguées de chaque personne (None si inexistante), terminaison déjà identifiée"""
+        radical = verb[:-len(suffix)]
+        return tuple(None if term is None else radical + term for term in cls.terminations[suffix])
+
+    @classmethod
+    def _rules(cls):
+        """Tables dont dépendent les formes de ce temps, prises en compte par `rules_fingerprint`"""
+        return sorted(cls.terminations.items())
+
+    @classmethod
+    def _render_both(cls, verb, suffix):
+        """
+        Construit en un seul passage les formes simples et interrogatives du verbe à partir de sa
+        terminaison déjà identifiée. Retourne deux listes de formes, sans les formes inexistantes.
+        """
+        radical = verb[:-len(suffix)]
+        simple = []
+        interrogative = []
+
+        for person, term in zip(cls.PRONOUNS.keys(), cls.terminations[suffix]):
+            if term is None:
+                continue
+
+            inflected = radical + term
+            inverted = cls._get_interrogative_verb(inflected, person)
+            for pronoun in cls.PRONOUNS[person]:
+                simple.append(cls._get_simple_form(inflected, pronoun, person))
+                if inverted is not None:
+                    interrogative.append(cls._join_interrogative(inverted, pronoun, person))
 
+        return simple, interrogative
+
+    @classmethod
+    def _iter_forms(cls, verb, suffix, interrogative):
+        """
+        Génère les triplets (personne, pronom, forme) du verbe à partir de sa terminaison déjà
+        identifiée. Les personnes sans conjugaison (verbes défectifs) sont omises.
+        """
+        radical = verb[:-len(suffix)]
+        get_form = cls._get_interrogative_form if interrogative else cls._get_simple_form
+
+        for person, term in zip(cls.PRONOUNS.keys(), cls.terminations[suffix]):
+            if term is not None:
+                for pronoun in cls.PRONOUNS[person]:
+                    yield person, pronoun, get_form(radical + term, pronoun, person)
+
+    @classmethod
+    def _match_suffix(cls, verb):
+        """
+        Retourne la plus longue terminaison de `cls.terminations` qui termine le verbe, None si
+        aucune ne convient. Parcourt l'arbre des terminaisons inversées en O(len(verb)).
+        """
+        node = cls._suffix_trie
+        match = node.get(cls._TRIE_END)
+        for char in reversed(verb):
+            node = node.get(char)
+            if node is None:
                 break
+            match = node.get(cls._TRIE_END, match)
+        return match
 
-        return result
+    @staticmethod
+    def _build_suffix_trie(terminations):
+        """
+        Construit un arbre des terminaisons lues à l'envers (dernier caractère en premier).
+        Chaque noeud est un dictionnaire {caractère: noeud}, la terminaison complète est stockée
+        sous la clé `_TRIE_END` du noeud où elle se termine.
+        """
+        trie = {}
+        for suffix in terminations:
+            node = trie
+            for char in reversed(suffix):
+                node = node.setdefault(char, {})
+            node[Tense._TRIE_END] = suffix
+        return trie
 
     @classmethod
-    def _get_interrogative_form(cls, verb, pronoun, person):
+    def _iter_inflections(cls, verb, suffix, interrogative):
+        """
+        Comme `_iter_forms` mais sans pronom : génère les triplets (personne, pronom, verbe) où
+        le verbe est la forme conjuguée seule, telle qu'écrite à la forme demandée.
+        """
+        radical = verb[:-len(suffix)]
+
+        for person, term in zip(cls.PRONOUNS.keys(), cls.terminations[suffix]):
+            if term is not None:
+                inflected = radical + term
+                if interrogative:
+                    inflected = cls._get_interrogative_verb(inflected, person)
+                    if inflected is None:
+                        continue
+                for pronoun in cls.PRONOUNS[person]:
+                    yield person, pronoun, inflected
+
+    # Personnes pour lesquelles un '-t-' euphonique peut s'intercaler avant le pronom
+    _EUPHONIC_T_PERSONS = frozenset(["3ps", "3pp"])
+
+    @classmethod
+    def _get_interrogative_verb(cls, verb, person):
+        """Retourne le verbe conjugué tel qu'écrit devant le pronom inversé"""
         if person == "1ps":
             # On remplace .....e-je par .....é-je (exemple: demande-je devient demandé-je)
             if verb.endswith("e"):
@@ -56,14 +403,24 @@ class Tense:
 
             # Remplacement des terminaisons "è.é-je" par "e.é-je"
             # exemple: "pèlé-je" devient "pelé-je"
-            verb = re.sub(r'è(.)é$', r'e\g<1>é', verb)
+            if len(verb) >= 3 and verb[-3] == "è" and verb[-1] == "é":
+                verb = verb[:-3] + "e" + verb[-2:]
 
+        return verb
+
+    @classmethod
+    def _join_interrogative(cls, verb, pronoun, person):
+        """Assemble le verbe déjà transformé par `_get_interrogative_verb` et le pronom inversé"""
         # Ajout de '-t-' avec il/elle et ils/elles si voyelle en fin de verbe
-        if person in ["3ps", "3pp"] and verb.endswith("aeiou"):
+        if person in cls._EUPHONIC_T_PERSONS and verb.endswith("aeiou"):
             verb = verb + "-t"
 
         return f"{verb}-{pronoun} ?"
 
+    @classmethod
+    def _get_interrogative_form(cls, verb, pronoun, person):
+        return cls._join_interrogative(cls._get_interrogative_verb(verb, person), pronoun, person)
+
     @classmethod
     def _get_simple_form(cls, verb, pronoun, person):
         # "j'" si le verbe commence par une voyelle
@@ -71,6 +428,16 @@ class Tense:
             return f"j'{verb}"
         return f"{pronoun} {verb}"
 
+    def __init_subclass__(cls, **kwargs):
+        """
+        Prépare l'arbre des terminaisons de chaque temps, compilé une seule fois à sa première
+        utilisation.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._person_index = {person: i for i, person in enumerate(cls.PRONOUNS)}
+        cls._suffix_trie = lazy_table(lambda tense: tense._build_suffix_trie(tense.terminations),
+                                      "_suffix_trie")
+
 
 class IndicatifPresent(Tense):
     """Règles de conjugaison pour le présent de l'indicatif"""
@@ -218,7 +585,7 @@ class IndicatifPresent(Tense):
     terminations_group1.update(generate_eacute_terms.__func__())
     terminations_group1.update(generate_exceptions_group1.__func__())
 
-    terminations = {**terminations_group1, **terminations_group2, **terminations_group3}
+    terminations = lazy_table(_merged_groups)
 
 
 class IndicatifFutur(Tense):
@@ -252,7 +619,7 @@ class IndicatifFutur(Tense):
     terminations_group3 = {"e": ["ai", "as", "a", "ons", "ez", "ont"],
                            "": ["ai", "as", "a", "ons", "ez", "ont"],
                            "aller": ["irai", "iras", "ira", "irons", "irez", "iront"],
-                           "avoir": ["aurai", "auras", "aura", "auront", "aurez", "auront"],
+                           "avoir": ["aurai", "auras", "aura", "aurons", "aurez", "auront"],
                            "être": ["serai", "seras", "sera", "serons", "serez", "seront"],
                            "asseoir": ["assoirai", "assoiras", "assoira", "assoirons", "assoirez", "assoiront"],
                            "cevoir": ["cevrai", "cevras", "cevra", "cevrons", "cevrez", "cevront"],
@@ -277,7 +644,7 @@ class IndicatifFutur(Tense):
                            "voir": ["verrai", "verras", "verra", "verrons", "verrez", "verront"],
                            "vouloir": ["voudrai", "voudras", "voudra", "voudrons", "voudrez", "voudront"]}
 
-    terminations = {**terminations_group1, **terminations_group2, **terminations_group3}
+    terminations = lazy_table(_merged_groups)
 
 
 class IndicatifImparfait(Tense):
@@ -285,40 +652,21 @@ class IndicatifImparfait(Tense):
     Imparfait de l'indicatif
     """
 
-    @staticmethod
-    def generate_terminations_group3():
-        """
-        Génère automatiquement les terminaisons de l'imparfait des verbes du 3ème groupe à partir
-        de la conjugaison au présent pour la première personne du pluriel.
-        """
-        terminations_imparfait = {}
-
-        # Récupération des terminaisons du présent de l'indicatif
-        for term, conjug in IndicatifPresent.terminations_group3.items():
-            if conjug[3] is None:
-                continue
-
-            # Suppression de '-ons' à la première personne du pluriel pour former le radical
-            radical = conjug[3][:-3]
-
-            # Génération des terminaisons
-            terminations_imparfait[term] = [radical + t for t in ["ais", "ais", "ait", "ions", "iez", "aient"]]
-
-        return terminations_imparfait
-
     terminations_group1 = {"er": ["ais", "ais", "ait", "ions", "iez", "aient"],
                            "ger": ["geais", "geais", "geait", "gions", "giez", "geaient"]}
     terminations_group2 = {"ir": ["issais", "issais", "issait", "issions", "issiez", "issaient"],
                            "ïr": ["ïssais", "ïssais", "ïssait", "ïssions", "ïssiez", "ïssaient"]}
 
-    terminations_group3 = generate_terminations_group3.__func__()
-    terminations_group3.update({"être": ["étais", "étais", "était", "étions", "étiez", "étaient"],
-                                "falloir": [None, None, "fallait", None, None, None],
-                                "frire": [None, None, None, None, None, None],
-                                "pleuvoir": [None, None, "pleuvait", None, None, "pleuvaient"],
-                                "seoir": [None, None, "seyait", None, None, "seyaient"]})
+    # Verbes du 3ème groupe : radical du présent à la première personne du pluriel, sans '-ons'
+    terminations_group3 = derived_table(
+        IndicatifPresent, ["ais", "ais", "ait", "ions", "iez", "aient"], table="terminations_group3",
+        overrides={"être": ["étais", "étais", "était", "étions", "étiez", "étaient"],
+                   "falloir": [None, None, "fallait", None, None, None],
+                   "frire": [None, None, None, None, None, None],
+                   "pleuvoir": [None, None, "pleuvait", None, None, "pleuvaient"],
+                   "seoir": [None, None, "seyait", None, None, "seyaient"]})
 
-    terminations = {**terminations_group1, **terminations_group2, **terminations_group3}
+    terminations = lazy_table(_merged_groups)
 
 
 class IndicatifPasseSimple(Tense):
@@ -401,7 +749,7 @@ class IndicatifPasseSimple(Tense):
                            "voir": generate_terminations_group3.__func__("v", _TERMS_I),
                            "vouloir": generate_terminations_group3.__func__("voul", _TERMS_U)}
 
-    terminations = {**terminations_group1, **terminations_group2, **terminations_group3}
+    terminations = lazy_table(_merged_groups)
 
 
 class ConditionnelPresent(Tense):
@@ -409,28 +757,9 @@ class ConditionnelPresent(Tense):
     Conditionnel présent
     """
 
-    @staticmethod
-    def generate_terminations():
-        """
-        Génère automatiquement les terminaisons du conditionnel à partir de la conjugaison au futur
-        de la première personne du pluriel.
-        """
-        terminations_conditionnel = {}
-
-        # Récupération des terminaisons du futur de l'indicatif
-        for term, conjug in IndicatifFutur.terminations.items():
-            if conjug[3] is None:
-                continue
-
-            # Suppression de '-ons' à la première personne du pluriel pour former le radical
-            radical = conjug[3][:-3]
-
-            # Génération des terminaisons
-            terminations_conditionnel[term] = [radical + t for t in ["ais", "ais", "ait", "ions", "iez", "aient"]]
+    # Radical du futur à la première personne du pluriel, sans '-ons'
+    terminations = derived_table(IndicatifFutur, ["ais", "ais", "ait", "ions", "iez", "aient"])
 
-        return terminations_conditionnel
-
-    terminations = generate_terminations.__func__()
 
 class Imperatif(Tense):
     """
@@ -442,31 +771,63 @@ class Imperatif(Tense):
                 "2pp": [""]}
 
 
-    @staticmethod
-    def generate_terminations():
-        """
-        Génère automatiquement les terminaisons de l'impératif à partir de la conjugaison au présent
-        """
-        terminations_imperatif = {}
+    # Formes du présent aux première personne du singulier et du pluriel, et deuxième du pluriel
+    terminations = derived_table(
+        IndicatifPresent, [("1ps", ""), ("1pp", ""), ("2pp", "")], stem=lambda form: form,
+        overrides={"avoir": ["aie", "ayons", "ayez"],
+                   "être": ["sois", "soyons", "soyez"],
+                   "aller": ["va", "allons", "allez"],
+                   "savoir": ["sache", "sachons", "sachez"],
+                   "vouloir": ["veux", "voulons", "voulez"],
+                   "pouvoir": [None, None, None]})
 
-        # Récupération des terminaisons du présent de l'indicatif
-        for term, conjug in IndicatifPresent.terminations.items():
-            if conjug[3] is None:
-                continue
 
-            # Génération des terminaisons
-            terminations_imperatif[term] = [conjug[0], conjug[3], conjug[4]]
+    @classmethod
+    def _get_interrogative_verb(cls, verb, person):
+        return None
+
+    @classmethod
+    def _get_interrogative_form(cls, verb, pronoun, person):
+        return None
+
+    @classmethod
+    def _get_simple_form(cls, verb, pronoun, person):
+        return f"{verb} !"
+
+
+def _plural_stem(form):
+    """
+    Radical d'une forme du pluriel en '-ons' ou '-ent', sans le 'e' ni la cédille qui ne servent
+    que devant '-ons' : "mangeons" -> "mang", "plaçons" -> "plac", "prennent" -> "prenn"
+    """
+    stem = form[:-3]
+    if form.endswith("geons"):
+        return stem[:-1]
+    if form.endswith("çons"):
+        return stem[:-1] + "c"
+    return stem
+
 
-        return terminations_imperatif
+def _strip_t(form):
+    """Radical du passé simple à la troisième personne du singulier : "finit" -> "fini" """
+    return form[:-1] if form.endswith("t") else form
 
-    terminations = generate_terminations.__func__()
-    terminations.update({"avoir": ["aie", "ayons", "ayez"],
-                         "être": ["sois", "soyons", "soyez"],
-                         "aller": ["va", "allons", "allez"],
-                         "savoir": ["sache", "sachons", "sachez"],
-                         "vouloir": ["veux", "voulons", "voulez"],
-                         "pouvoir": [None, None, None]})
 
+def _circumflex_t(stem):
+    """Troisième personne du subjonctif imparfait : accent circonflexe sur la voyelle finale, puis 't'"""
+    if stem.endswith("in"):
+        return stem[:-2] + "înt"
+    return stem[:-1] + {"a": "â", "i": "î", "u": "û"}.get(stem[-1], stem[-1]) + "t"
+
+
+class SubjunctiveTense(Tense):
+    """
+    Temps du subjonctif : formes précédées de "que", sans forme interrogative
+    """
+
+    @classmethod
+    def _get_interrogative_verb(cls, verb, person):
+        return None
 
     @classmethod
     def _get_interrogative_form(cls, verb, pronoun, person):
@@ -474,82 +835,2041 @@ class Imperatif(Tense):
 
     @classmethod
     def _get_simple_form(cls, verb, pronoun, person):
-        return f"{verb} !"
+        form = super()._get_simple_form(verb, pronoun, person)
+        # "qu'il", "qu'elle", "qu'on" ; "que j'aime" est déjà élidé par le pronom
+        if form.startswith(("il", "elle", "on")):
+            return f"qu'{form}"
+        return f"que {form}"
 
 
+class SubjonctifPresent(SubjunctiveTense):
+    """
+    Subjonctif présent
+    """
+
+    # Radical du présent à la troisième personne du pluriel, et à la première du pluriel pour
+    # "nous" et "vous" (que nous prenions, qu'ils prennent)
+    terminations = derived_table(
+        IndicatifPresent, ["e", "es", "e", ("1pp", "ions"), ("1pp", "iez"), "ent"], source="3pp",
+        stem=_plural_stem, keep_missing=True,
+        overrides={"avoir": ["aie", "aies", "ait", "ayons", "ayez", "aient"],
+                   "être": ["sois", "sois", "soit", "soyons", "soyez", "soient"],
+                   "aller": ["aille", "ailles", "aille", "allions", "alliez", "aillent"],
+                   "faire": ["fasse", "fasses", "fasse", "fassions", "fassiez", "fassent"],
+                   "falloir": [None, None, "faille", None, None, None],
+                   "pleuvoir": [None, None, "pleuve", None, None, "pleuvent"],
+                   "pouvoir": ["puisse", "puisses", "puisse", "puissions", "puissiez", "puissent"],
+                   "savoir": ["sache", "saches", "sache", "sachions", "sachiez", "sachent"],
+                   "seoir": [None, None, "siée", None, None, "siéent"],
+                   "valoir": ["vaille", "vailles", "vaille", "valions", "valiez", "vaillent"],
+                   "vouloir": ["veuille", "veuilles", "veuille", "voulions", "vouliez", "veuillent"]})
+
+
+class SubjonctifImparfait(SubjunctiveTense):
+    """
+    Subjonctif imparfait
+    """
+
+    # Radical du passé simple à la troisième personne du singulier, sans '-t'
+    terminations = derived_table(
+        IndicatifPasseSimple, ["sse", "sses", _circumflex_t, "ssions", "ssiez", "ssent"],
+        source="3ps", stem=_strip_t, keep_missing=True,
+        overrides={"falloir": [None, None, "fallût", None, None, None],
+                   "frire": [None, None, None, None, None, None],
+                   "pleuvoir": [None, None, "plût", None, None, None]})
 
 
-def conjugate(verb, tense, interrogative=False):
+class ParticipePasse(Tense):
     """
-    Conjugue un verbe au temps demandé. Possibilité d'avoir la forme interrogative.
+    Participe passé, masculin singulier : une seule forme par verbe, sans pronom
+    """
+
+    PRONOUNS = {"pp": [""]}
+
+    terminations_group1 = {"er": ["é"]}
+    terminations_group2 = {"ir": ["i"],
+                           "ïr": ["ï"]}
+    terminations_group3 = {"aître": ["u"],
+                           "asseoir": ["assis"],
+                           "avoir": ["eu"],
+                           "boire": ["bu"],
+                           "cevoir": ["çu"],
+                           "choir": ["chu"],
+                           "clore": ["clos"],
+                           "clure": ["clu"],
+                           "concire": ["concis"],
+                           "confire": ["confit"],
+                           "coudre": ["cousu"],
+                           "courir": ["couru"],
+                           "croire": ["cru"],
+                           "croître": ["crû"],
+                           "devoir": ["dû"],
+                           "dire": ["dit"],
+                           "dre": ["du"],
+                           "écrire": ["écrit"],
+                           "émouvoir": ["ému"],
+                           "être": ["été"],
+                           "faire": ["fait"],
+                           "falloir": ["fallu"],
+                           "ffrir": ["ffert"],
+                           "foutre": ["foutu"],
+                           "frire": ["frit"],
+                           "gésir": [None],
+                           "inclure": ["inclus"],
+                           "indre": ["int"],
+                           "lire": ["lu"],
+                           "luire": ["lui"],
+                           "mettre": ["mis"],
+                           "moudre": ["moulu"],
+                           "mourir": ["mort"],
+                           "mouvoir": ["mû"],
+                           "naître": ["né"],
+                           "nuire": ["nui"],
+                           "occlure": ["occlus"],
+                           "onnaître": ["onnu"],
+                           "ouvrir": ["ouvert"],
+                           "paître": [None],
+                           "plaire": ["plu"],
+                           "pleuvoir": ["plu"],
+                           "pouvoir": ["pu"],
+                           "prendre": ["pris"],
+                           "promouvoir": ["promu"],
+                           "quérir": ["quis"],
+                           "raire": ["rait"],
+                           "re": ["u"],
+                           "résoudre": ["résolu"],
+                           "rire": ["ri"],
+                           "savoir": ["su"],
+                           "scrire": ["scrit"],
+                           "seoir": ["sis"],
+                           "soudre": ["sous"],
+                           "suffire": ["suffi"],
+                           "suivre": ["suivi"],
+                           "taire": ["tu"],
+                           "tenir": ["tenu"],
+                           "uire": ["uit"],
+                           "valoir": ["valu"],
+                           "venir": ["venu"],
+                           "vêtir": ["vêtu"],
+                           "vivre": ["vécu"],
+                           "voir": ["vu"],
+                           "vouloir": ["voulu"]}
+
+    terminations = lazy_table(_merged_groups)
+
+    @classmethod
+    def _get_interrogative_verb(cls, verb, person):
+        return None
+
+    @classmethod
+    def _get_interrogative_form(cls, verb, pronoun, person):
+        return None
+
+    @classmethod
+    def _get_simple_form(cls, verb, pronoun, person):
+        return verb
+
+
+class CompoundTense(Tense):
+    """
+    Temps composé : auxiliaire avoir ou être conjugué dans `AUXILIARY_TENSE`, suivi du participe
+    passé. Le participe est accordé avec le sujet quand l'auxiliaire est être.
+
+    Les terminaisons sont celles de `ParticipePasse`, répétées pour chaque personne ; les
+    conjugaisons des deux auxiliaires ne sont calculées qu'une fois par temps, à la première
+    utilisation. Les formes des tables (`ConjugationTable.form`) sont "auxiliaire participe", le
+    participe n'y est pas encore accordé.
+    """
+
+    AUXILIARY_TENSE = None
+
+    # Seules personnes des verbes qui n'existent pas à toutes (impersonnels, seoir). Les autres
+    # verbes défectifs au présent (clore, frire...) ont des temps composés complets.
+    DEFECTIVE_VERBS = {"falloir": ("3ps",),
+                       "pleuvoir": ("3ps", "3pp"),
+                       "repleuvoir": ("3ps", "3pp"),
+                       "seoir": ("3ps", "3pp"),
+                       "messeoir": ("3ps", "3pp")}
+
+    # Verbes conjugués avec être (intransitifs) ; tous les autres le sont avec avoir
+    ETRE_VERBS = frozenset(["advenir", "aller", "arriver", "décéder", "descendre", "devenir",
+                            "entrer", "intervenir", "monter", "mourir", "naître", "partir",
+                            "parvenir", "passer", "redescendre", "redevenir", "remonter",
+                            "renaître", "rentrer", "repartir", "ressortir", "rester", "retomber",
+                            "retourner", "revenir", "sortir", "survenir", "tomber", "venir"])
+
+    _FEMININE_PRONOUNS = frozenset(["elle", "elles"])
+    _PLURAL_PERSONS = frozenset(["1pp", "2pp", "3pp"])
+
+    terminations = lazy_table(lambda cls: {suffix: terms * len(cls.PRONOUNS)
+                                           for suffix, terms in ParticipePasse.terminations.items()})
+
+    @lazy_table
+    def _auxiliaries(cls):
+        """Formes de chaque auxiliaire, {"avoir": (ai, as, ...), "être": (suis, es, ...)}"""
+        return {auxiliary: cls.AUXILIARY_TENSE.conjugate(auxiliary, interrogative=False).forms
+                for auxiliary in ("avoir", "être")}
+
+    @classmethod
+    def _forms(cls, verb, suffix):
+        auxiliary = cls._auxiliaries["être" if verb in cls.ETRE_VERBS else "avoir"]
+        persons = cls.DEFECTIVE_VERBS.get(verb, cls.PRONOUNS)
+        participles = super()._forms(verb, suffix)
+        return tuple(None if participle is None or person not in persons else f"{auxiliary[i]} {participle}"
+                     for i, (person, participle) in enumerate(zip(cls.PRONOUNS, participles)))
+
+    @classmethod
+    def _rules(cls):
+        return (super()._rules(), sorted(cls._auxiliaries.items()), sorted(cls.ETRE_VERBS),
+                sorted(cls.DEFECTIVE_VERBS.items()))
+
+    @classmethod
+    def _agree(cls, form, pronoun, person):
+        """Sépare l'auxiliaire du participe, accordé en genre et en nombre avec l'auxiliaire être"""
+        auxiliary, participle = form.split(" ", 1)
+        if auxiliary == cls._auxiliaries["être"][cls._person_index[person]]:
+            if pronoun in cls._FEMININE_PRONOUNS:
+                participle += "e"
+            if person in cls._PLURAL_PERSONS and not participle.endswith("s"):
+                participle += "s"
+        return auxiliary, participle
+
+    @classmethod
+    def _invert(cls, auxiliary, participle, pronoun, person):
+        """Forme interrogative : pronom inversé après l'auxiliaire, participe à la suite"""
+        inverted = cls._join_interrogative(cls.AUXILIARY_TENSE._get_interrogative_verb(auxiliary, person),
+                                           pronoun, person)
+        # `_join_interrogative` termine la forme par " ?", le participe s'intercale avant
+        return f"{inverted[:-2]} {participle} ?"
+
+    @classmethod
+    def _join_interrogative(cls, verb, pronoun, person):
+        # "-t-" euphonique après un auxiliaire terminé par une voyelle : "a-t-il", "sera-t-elle".
+        # La règle des temps simples n'ajoute jamais le "-t-" ; elle est gardée telle quelle pour
+        # que leur dictionnaire ne change pas, ces temps-ci sont nouveaux.
+        if person in cls._EUPHONIC_T_PERSONS and verb.endswith(("a", "e")):
+            verb += "-t"
+        return f"{verb}-{pronoun} ?"
+
+    @classmethod
+    def _get_interrogative_form(cls, verb, pronoun, person):
+        return cls._invert(*cls._agree(verb, pronoun, person), pronoun, person)
+
+    @classmethod
+    def _get_simple_form(cls, verb, pronoun, person):
+        auxiliary, participle = cls._agree(verb, pronoun, person)
+        return super()._get_simple_form(f"{auxiliary} {participle}", pronoun, person)
+
+    @classmethod
+    def _render_both(cls, verb, suffix):
+        simple = []
+        interrogative = []
+        for person, form in zip(cls.PRONOUNS, cls._forms(verb, suffix)):
+            if form is None:
+                continue
+            for pronoun in cls.PRONOUNS[person]:
+                auxiliary, participle = cls._agree(form, pronoun, person)
+                simple.append(super()._get_simple_form(f"{auxiliary} {participle}", pronoun, person))
+                interrogative.append(cls._invert(auxiliary, participle, pronoun, person))
+        return simple, interrogative
+
+    @classmethod
+    def _iter_forms(cls, verb, suffix, interrogative):
+        get_form = cls._get_interrogative_form if interrogative else cls._get_simple_form
+        for person, form in zip(cls.PRONOUNS, cls._forms(verb, suffix)):
+            if form is not None:
+                for pronoun in cls.PRONOUNS[person]:
+                    yield person, pronoun, get_form(form, pronoun, person)
+
+    @classmethod
+    def _iter_inflections(cls, verb, suffix, interrogative):
+        for person, form in zip(cls.PRONOUNS, cls._forms(verb, suffix)):
+            if form is None:
+                continue
+            for pronoun in cls.PRONOUNS[person]:
+                auxiliary, participle = cls._agree(form, pronoun, person)
+                if interrogative:
+                    auxiliary = cls.AUXILIARY_TENSE._get_interrogative_verb(auxiliary, person)
+                yield person, pronoun, f"{auxiliary} {participle}"
+
+
+class PasseCompose(CompoundTense):
+    """Passé composé de l'indicatif"""
+    AUXILIARY_TENSE = IndicatifPresent
+
+
+class PlusQueParfait(CompoundTense):
+    """Plus-que-parfait de l'indicatif"""
+    AUXILIARY_TENSE = IndicatifImparfait
+
+
+class FuturAnterieur(CompoundTense):
+    """Futur antérieur de l'indicatif"""
+    AUXILIARY_TENSE = IndicatifFutur
+
+
+class ConditionnelPasse(CompoundTense):
+    """Conditionnel passé"""
+    AUXILIARY_TENSE = ConditionnelPresent
+
+
+
+
+def _tense_classes(base=None):
+    """Toutes les classes de temps du module, sous-classes indirectes comprises"""
+    for tense in (base or Tense).__subclasses__():
+        yield tense
+        yield from _tense_classes(tense)
+
+
+class TenseRegistry(dict):
+    """
+    Temps disponibles, indexés par leur nom d'affichage et dans l'ordre d'affichage.
+    Les tables d'un temps ne sont construites qu'à sa première conjugaison.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Temps utilisés seulement quand ils sont demandés par leur nom (voir `register`)
+        self.optional = {}
+
+    def register(self, name, tense, default=True):
+        """
+        Enregistre un temps. Les temps enregistrés avec `default=False` ne font pas partie des
+        temps utilisés par défaut (tableau, dictionnaire, index) mais se choisissent par leur nom.
+        """
+        if default:
+            self[name] = tense
+        else:
+            self.optional[name] = tense
+        return tense
+
+    def resolve(self, name):
+        """Retourne le temps désigné par son nom d'affichage ou par le nom de sa classe"""
+        for tenses in (self, self.optional):
+            if name in tenses:
+                return tenses[name]
+            for tense in tenses.values():
+                if tense.__name__ == name:
+                    return tense
+        raise KeyError(name)
+
+    def name_of(self, tense):
+        """Retourne le nom d'affichage d'un temps, le nom de sa classe s'il n'est pas enregistré"""
+        for tenses in (self, self.optional):
+            for name, candidate in tenses.items():
+                if candidate is tense:
+                    return name
+        return tense.__name__
+
+    def names(self):
+        """Noms de tous les temps, ceux utilisés par défaut d'abord"""
+        return list(self) + list(self.optional)
+
+    def select(self, names):
+        """Retourne un registre restreint aux temps demandés, dans l'ordre demandé"""
+        selection = TenseRegistry()
+        for name in names:
+            tense = self.resolve(name)
+            selection.register(self.name_of(tense), tense)
+        return selection
+
+
+# Temps disponibles, dans l'ordre d'affichage
+TENSES = TenseRegistry()
+TENSES.register("Présent", IndicatifPresent)
+TENSES.register("Imparfait", IndicatifImparfait)
+TENSES.register("Futur", IndicatifFutur)
+TENSES.register("Passé simple", IndicatifPasseSimple)
+TENSES.register("Conditionnel", ConditionnelPresent)
+TENSES.register("Impératif", Imperatif)
+TENSES.register("Passé composé", PasseCompose, default=False)
+TENSES.register("Plus-que-parfait", PlusQueParfait, default=False)
+TENSES.register("Futur antérieur", FuturAnterieur, default=False)
+TENSES.register("Conditionnel passé", ConditionnelPasse, default=False)
+TENSES.register("Subjonctif présent", SubjonctifPresent, default=False)
+TENSES.register("Subjonctif imparfait", SubjonctifImparfait, default=False)
+
+
+@lru_cache(maxsize=None)
+def _merged_suffix_trie(tenses):
+    """
+    Fusionne les arbres de terminaisons de plusieurs temps en un seul. Chaque noeud terminal
+    contient la liste des (indice du temps, terminaison) qui s'y terminent.
+    """
+    trie = {}
+    for index, tense in enumerate(tenses):
+        for suffix in tense.terminations:
+            node = trie
+            for char in reversed(suffix):
+                node = node.setdefault(char, {})
+            node.setdefault(Tense._TRIE_END, []).append((index, suffix))
+    return trie
+
+
+def classify(verb, tenses):
+    """
+    Identifie en un seul parcours du verbe la terminaison la plus longue pour chacun des temps.
+    Retourne un tuple aligné sur `tenses` (None pour un temps sans terminaison correspondante).
+    """
+    matches = [None] * len(tenses)
+    node = _merged_suffix_trie(tenses)
+
+    for index, suffix in node.get(Tense._TRIE_END, ()):
+        matches[index] = suffix
+    for char in reversed(verb):
+        node = node.get(char)
+        if node is None:
+            break
+        for index, suffix in node.get(Tense._TRIE_END, ()):
+            matches[index] = suffix
+
+    return tuple(matches)
+
+
+def iter_conjugations(verbs, tenses=None, interrogative=False):
+    """
+    Conjugue une série de verbes à la volée.
+    Génère des tuples (verbe, temps, personne, pronom, forme), les formes inexistantes sont omises.
 
     Parameters
     ----------
-    verb : string
-        verbe à conjuguer
-    tense : string
-        temps à utiliser
+    verbs : iterable
+        verbes à conjuguer
+    tenses : iterable
+        temps à utiliser, tous les temps de `TENSES` par défaut
     interrogative : bool
         utiliser la forme interrogative ? False par défaut
     """
-    return tense.conjugate(verb, interrogative)
+    tenses = tuple(TENSES.values() if tenses is None else tenses)
 
+    for verb in verbs:
+        for tense, suffix in zip(tenses, classify(verb, tenses)):
+            if suffix is None:
+                continue
+            for person, pronoun, form in tense._iter_forms(verb, suffix, interrogative):
+                if form is not None:
+                    yield verb, tense, person, pronoun, form
 
-if __name__ == "__main__":
-    import os
-    import sys
 
-    arg1 = sys.argv[1]
+def conjugate_many(verbs, tenses=None, interrogative=False, lazy=False):
+    """
+    Conjugue plusieurs verbes d'un coup et retourne le résultat en colonnes parallèles.
+
+    Parameters
+    ----------
+    verbs : iterable
+        verbes à conjuguer
+    tenses : iterable
+        temps à utiliser, tous les temps de `TENSES` par défaut
+    interrogative : bool
+        utiliser la forme interrogative ? False par défaut
+    lazy : bool
+        retourner un générateur de lignes (voir `iter_conjugations`) plutôt que des colonnes ?
+        False par défaut
+
+    Returns
+    -------
+    dict
+        listes de même longueur "verb", "tense", "person", "pronoun" et "form"
+    """
+    rows = iter_conjugations(verbs, tenses, interrogative)
+    if lazy:
+        return rows
+
+    columns = {"verb": [], "tense": [], "person": [], "pronoun": [], "form": []}
+    appends = [column.append for column in columns.values()]
+    for row in rows:
+        for append, value in zip(appends, row):
+            append(value)
+    return columns
 
-    tenses = {"Présent": IndicatifPresent,
-              "Imparfait": IndicatifImparfait,
-              "Futur": IndicatifFutur,
-              "Passé simple": IndicatifPasseSimple,
-              "Conditionnel": ConditionnelPresent,
-              "Impératif": Imperatif}
 
-    # Fichier en entrée liste en sortie
-    if os.path.isfile(arg1):
-        with open(arg1) as fh:
-            for line in fh:
-                verb = line[:-1].lower()
+def split_paradigm(verb, tenses=None):
+    """
+    Classe le verbe une fois pour tous les temps.
+    Retourne le couple (paradigme, radicaux) : le paradigme est le tuple des terminaisons reconnues
+    (voir `classify`), les radicaux le tuple des radicaux correspondants, alignés sur `tenses`.
+    Deux verbes de même paradigme se conjuguent de la même façon, au radical près.
+    """
+    tenses = tuple(TENSES.values() if tenses is None else tenses)
+    paradigm = classify(verb, tenses)
+    return paradigm, tuple(None if suffix is None else verb[:-len(suffix)] for suffix in paradigm)
 
-                for tense in tenses:
-                    conjug = conjugate(verb, tenses[tense])
-                    for person in conjug:
-                        for pronoun in conjug[person]:
-                            if conjug[person][pronoun] is not None:
-                                print(conjug[person][pronoun])
 
-                    conjug = conjugate(verb, tenses[tense], interrogative=True)
-                    for person in conjug:
-                        for pronoun in conjug[person]:
-                            if conjug[person][pronoun] is not None:
-                                print(conjug[person][pronoun])
+class ParadigmIndex:
+    """
+    Verbes d'une liste regroupés par paradigme.
 
-    # Verbe en entrée, tableau de conjugaison en sortie
-    else:
-        verb = arg1
-        header = "|"
-        output = ["|"] * 6
-
-        for tense_name, tense in tenses.items():
-            header += f" {tense_name:20} |"
-            conjug = conjugate(verb, tense)
-
-            for i, person in enumerate(["1ps", "2ps", "3ps", "1pp", "2pp", "3pp"]):
-                try:
-                    for result in conjug[person].values():
-                        if result:
-                            output[i] += f" {result:20} |"
-                        else:
-                            output[i] += " " * 20 + "  |"
-                        break
-                except:
-                    output[i] += " " * 20 + "  |"
-
-        print(header)
-        print(("| " + "-" * 20 + " ") * len(tenses) + "|")
-
-        for line in output:
-            print(line)
+    Chaque verbe n'est classé qu'une fois ; sa conjugaison et la recherche des verbes qui se
+    conjuguent de la même façon ne sont ensuite que des lectures de tables.
+
+    Parameters
+    ----------
+    verbs : iterable
+        verbes à classer
+    tenses : iterable
+        temps à utiliser, tous les temps de `TENSES` par défaut
+    """
+
+    def __init__(self, verbs, tenses=None):
+        self.tenses = tuple(TENSES.values() if tenses is None else tenses)
+        self.groups = {}
+        self._paradigms = {}
+
+        for verb in verbs:
+            if verb not in self._paradigms:
+                paradigm = self._paradigms[verb] = classify(verb, self.tenses)
+                self.groups.setdefault(paradigm, []).append(verb)
+
+    def paradigm(self, verb):
+        """Paradigme du verbe, classé à la volée s'il n'est pas dans la liste"""
+        paradigm = self._paradigms.get(verb)
+        return classify(verb, self.tenses) if paradigm is None else paradigm
+
+    def like(self, verb):
+        """Verbes de la liste qui se conjuguent comme `verb` (lui compris s'il en fait partie)"""
+        return list(self.groups.get(self.paradigm(verb), ()))
+
+    def conjugate(self, verb, interrogative=False):
+        """
+        Conjugue le verbe dans tous les temps de l'index.
+        Retourne un `ConjugationTable` par temps, alignés sur `tenses`.
+        """
+        tables = []
+        for tense, suffix in zip(self.tenses, self.paradigm(verb)):
+            if suffix is None:
+                forms = (None,) * len(tense.PRONOUNS)
+            else:
+                forms = tense._forms(verb, suffix)
+            tables.append(ConjugationTable(tense, forms, interrogative))
+        return tables
+
+    def conjugate_group(self, paradigm, interrogative=False):
+        """Génère les couples (verbe, tables de `conjugate`) de tous les verbes d'un paradigme"""
+        for verb in self.groups.get(paradigm, ()):
+            yield verb, self.conjugate(verb, interrogative)
+
+    def report(self, top=10):
+        """
+        Nombre de verbes et de paradigmes, et les `top` paradigmes les plus fréquents avec leurs
+        terminaisons par temps et un verbe d'exemple.
+        """
+        sizes = sorted(self.groups.items(), key=lambda item: len(item[1]), reverse=True)
+        return {"verbs": len(self._paradigms),
+                "paradigms": len(self.groups),
+                "single_verb_paradigms": sum(1 for verbs in self.groups.values() if len(verbs) == 1),
+                "largest": [{"verbs": len(verbs),
+                             "example": verbs[0],
+                             "terminations": {TENSES.name_of(tense): suffix
+                                              for tense, suffix in zip(self.tenses, paradigm)}}
+                            for paradigm, verbs in sizes[:top]]}
+
+    def __len__(self):
+        return len(self.groups)
+
+
+class ConjugationCache:
+    """
+    Cache LRU borné des conjugaisons, indexé par (verbe, temps, forme interrogative).
+
+    Les `ConjugationTable` ne sont pas modifiables : le même tableau peut être rendu à tous les
+    appelants sans copie.
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, verb, tense, interrogative):
+        """Retourne le tableau en cache, None s'il est absent"""
+        key = (verb, tense, interrogative)
+        try:
+            conjug = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return conjug
+
+    def put(self, verb, tense, interrogative, conjug):
+        """Ajoute un tableau au cache en évinçant les entrées les moins récemment utilisées"""
+        if self.maxsize <= 0:
+            return
+
+        key = (verb, tense, interrogative)
+        self._entries[key] = conjug
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def resize(self, maxsize):
+        """Change la taille maximale du cache, en évinçant si nécessaire"""
+        self.maxsize = maxsize
+        while self._entries and len(self._entries) > max(maxsize, 0):
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """Vide le cache et remet les compteurs à zéro"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self):
+        return {"hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "maxsize": self.maxsize}
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# Cache partagé par `conjugate()`, sa taille se règle avec `CACHE.resize(n)`
+CACHE = ConjugationCache()
+
+
+def conjugate(verb, tense, interrogative=False, use_cache=True):
+    """
+    Conjugue un verbe au temps demandé. Possibilité d'avoir la forme interrogative.
+
+    Parameters
+    ----------
+    verb : string
+        verbe à conjuguer
+    tense : string
+        temps à utiliser
+    interrogative : bool
+        utiliser la forme interrogative ? False par défaut
+    use_cache : bool
+        passer par le cache LRU `CACHE` ? True par défaut
+    """
+    if not use_cache:
+        return tense.conjugate(verb, interrogative)
+
+    conjug = CACHE.get(verb, tense, interrogative)
+    if conjug is None:
+        conjug = tense.conjugate(verb, interrogative)
+        CACHE.put(verb, tense, interrogative, conjug)
+    return conjug
+
+
+def read_verbs(path):
+    """Génère les verbes d'une liste de verbes (un par ligne), en minuscules, sans lignes vides"""
+    with open(path) as fh:
+        for line in fh:
+            verb = line.strip().lower()
+            if verb:
+                yield verb
+
+
+PERSONS = ("1ps", "2ps", "3ps", "1pp", "2pp", "3pp")
+
+
+class _MappedIndex:
+    """
+    Base des index projetés en mémoire : tableaux d'entiers et tables de chaînes alignés sur
+    4 octets, lus directement dans le fichier.
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @staticmethod
+    def _aligned(size):
+        return (size + 3) & ~3
+
+    @classmethod
+    def _pad(cls, data):
+        return data + b"\0" * (cls._aligned(len(data)) - len(data))
+
+    @staticmethod
+    @contextmanager
+    def _replacing(path):
+        """
+        Fichier binaire temporaire propre au processus, renommé en `path` une fois écrit : les
+        lecteurs ne voient jamais un index partiel, même si plusieurs processus le construisent.
+        """
+        import tempfile
+
+        fd, temporary = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)),
+                                         prefix=os.path.basename(path) + ".")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                yield fh
+            os.chmod(temporary, 0o644)
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    @staticmethod
+    def _read_tenses(path, names):
+        """Classes de temps désignées par leur nom dans l'en-tête d'un index"""
+        tenses = {tense.__name__: tense for tense in _tense_classes()}
+        try:
+            return [tenses[name] for name in names]
+        except KeyError as error:
+            raise ValueError(f"{path} : temps inconnu {error.args[0]!r}") from None
+
+    @classmethod
+    def _write_strings(cls, fh, strings):
+        offsets = array("I", [0])
+        for string in strings:
+            offsets.append(offsets[-1] + len(string))
+        offsets.tofile(fh)
+        fh.write(cls._pad(b"".join(strings)))
+
+    @classmethod
+    def _read_strings(cls, view, position, count):
+        offsets = view[position:position + 4 * (count + 1)].cast("I")
+        position += 4 * (count + 1)
+        blob = view[position:position + offsets[-1]]
+        return offsets, blob, position + cls._aligned(offsets[-1])
+
+    @staticmethod
+    def _string(offsets, blob, i):
+        return blob[offsets[i]:offsets[i + 1]].tobytes()
+
+    @classmethod
+    def _bisect_strings(cls, offsets, blob, key, lo, hi):
+        """Première position de [lo, hi) dont la chaîne n'est pas inférieure à `key`"""
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if cls._string(offsets, blob, mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+
+class FormIndex(_MappedIndex):
+    """
+    Index des formes conjuguées (sans pronom) vers leur infinitif, leur temps et leur personne.
+
+    Le fichier est projeté en mémoire avec mmap et interrogé par dichotomie sur des tableaux triés :
+    l'index n'est jamais chargé sous forme d'objets Python.
+
+    Format (entiers non signés de 32 bits dans l'ordre natif, sections alignées sur 4 octets) :
+        MAGIC, nombre de formes, nombre de verbes, taille de l'en-tête
+        en-tête : empreinte puis noms des temps, séparés par des retours à la ligne
+        positions des verbes (nombre de verbes + 1) puis verbes en UTF-8
+        positions des formes (nombre de formes + 1) puis formes en UTF-8, triées
+        numéro du verbe de chaque forme, puis numéros du temps et de la personne (un octet chacun)
+    """
+    MAGIC = b"CJMIDX01"
+
+    def __init__(self, path):
+        with open(path, "rb") as fh:
+            self._mmap = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+        view = memoryview(self._mmap)
+        try:
+            if view[:8] != self.MAGIC:
+                raise ValueError(f"{path} n'est pas un index de formes conjuguées")
+
+            size, n_verbs, header_size = view[8:20].cast("I")
+            header = view[20:20 + header_size].tobytes().decode().split("\n")
+            self.fingerprint = header[0]
+            self.tenses = self._read_tenses(path, header[1:])
+        except ValueError:
+            view.release()
+            self._mmap.close()
+            raise
+
+        position = 20 + self._aligned(header_size)
+        self._verb_offsets, self._verbs, position = self._read_strings(view, position, n_verbs)
+        self._form_offsets, self._forms, position = self._read_strings(view, position, size)
+        self._verb_ids = view[position:position + 4 * size].cast("I")
+        position += 4 * size
+        self._tense_ids = view[position:position + size]
+        self._person_ids = view[position + size:position + 2 * size]
+        self._view = view
+        self._size = size
+
+    @classmethod
+    def build(cls, verbs, path, tenses=None, fingerprint=""):
+        """
+        Conjugue les verbes à tous les temps et écrit l'index de leurs formes dans `path`.
+        """
+        tenses = tuple(TENSES.values() if tenses is None else tenses)
+        verbs = list(dict.fromkeys(verbs))
+        person_ids = {person: i for i, person in enumerate(PERSONS)}
+
+        entries = set()
+        for verb_id, verb in enumerate(verbs):
+            for tense_id, (tense, suffix) in enumerate(zip(tenses, classify(verb, tenses))):
+                if suffix is None:
+                    continue
+                for person, _, form in tense._iter_inflections(verb, suffix, False):
+                    entries.add((form.encode(), verb_id, tense_id, person_ids[person]))
+        entries = sorted(entries)
+
+        header = "\n".join([fingerprint] + [tense.__name__ for tense in tenses]).encode()
+        with cls._replacing(path) as fh:
+            fh.write(cls.MAGIC)
+            array("I", [len(entries), len(verbs), len(header)]).tofile(fh)
+            fh.write(cls._pad(header))
+            cls._write_strings(fh, [verb.encode() for verb in verbs])
+            cls._write_strings(fh, [entry[0] for entry in entries])
+            array("I", [entry[1] for entry in entries]).tofile(fh)
+            fh.write(bytes(entry[2] for entry in entries))
+            fh.write(bytes(entry[3] for entry in entries))
+
+    def lemmatize(self, form):
+        """
+        Retourne la liste des (infinitif, temps, personne) dont `form` est une forme conjuguée,
+        vide si la forme est inconnue.
+        """
+        key = form.strip().lower().encode()
+        result = []
+
+        i = self._bisect_left(key)
+        while i < self._size and self._form(i) == key:
+            result.append((self.verb(self._verb_ids[i]), self.tenses[self._tense_ids[i]],
+                           PERSONS[self._person_ids[i]]))
+            i += 1
+
+        return result
+
+    def verb(self, verb_id):
+        return self._verbs[self._verb_offsets[verb_id]:self._verb_offsets[verb_id + 1]].tobytes().decode()
+
+    def close(self):
+        for view in (self._verb_offsets, self._verbs, self._form_offsets, self._forms,
+                     self._verb_ids, self._tense_ids, self._person_ids, self._view):
+            view.release()
+        self._mmap.close()
+
+    def __len__(self):
+        return self._size
+
+    def _form(self, i):
+        return self._string(self._form_offsets, self._forms, i)
+
+    def _bisect_left(self, key, lo=0):
+        return self._bisect_strings(self._form_offsets, self._forms, key, lo, self._size)
+
+
+def _cache_path(path):
+    """Emplacement de repli, dans le cache de l'utilisateur, d'un fichier écrit à côté du module"""
+    cache = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache, "conjugue_moi", os.path.basename(path))
+
+
+def _open_index(cls, path, fingerprint, build):
+    """
+    Ouvre l'index `cls` écrit dans `path`, ou à défaut dans le cache de l'utilisateur, s'il
+    correspond à `fingerprint`. Sinon le construit avec `build(path)`, dans le cache de
+    l'utilisateur si `path` n'est pas accessible en écriture (installation en lecture seule).
+    """
+    for candidate in (path, _cache_path(path)):
+        try:
+            index = cls(candidate)
+        except (OSError, ValueError):
+            continue
+        if index.fingerprint == fingerprint:
+            return index
+        index.close()
+
+    try:
+        build(path)
+    except OSError:
+        path = _cache_path(path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        build(path)
+    return cls(path)
+
+
+_form_index = None
+
+
+def _default_form_index():
+    """
+    Ouvre l'index des formes de la liste de verbes fournie avec le module. L'index est
+    (re)construit s'il est absent ou si le module ou la liste de verbes ont changé depuis.
+    """
+    global _form_index
+
+    if _form_index is None:
+        fingerprint = f"{_source_fingerprint()}-{_file_crc(VERBS_PATH)}"
+        _form_index = _open_index(FormIndex, FORM_INDEX_PATH, fingerprint,
+                                  lambda path: FormIndex.build(read_verbs(VERBS_PATH), path,
+                                                               fingerprint=fingerprint))
+
+    return _form_index
+
+
+def lemmatize(form, index=None):
+    """
+    Retrouve l'infinitif, le temps et la personne d'une forme conjuguée.
+
+    Parameters
+    ----------
+    form : string
+        forme conjuguée sans pronom, par exemple "mangeâmes"
+    index : FormIndex
+        index à interroger, par défaut celui de la liste de verbes fournie avec le module
+
+    Returns
+    -------
+    list
+        tuples (infinitif, temps, personne), plusieurs si la forme est ambiguë
+    """
+    return (index if index is not None else _default_form_index()).lemmatize(form)
+
+
+def read_frequencies(path):
+    """Lit un fichier de fréquences, une forme et son nombre d'occurrences par ligne"""
+    frequencies = {}
+    with open(path) as fh:
+        for line in fh:
+            fields = line.split()
+            if len(fields) >= 2:
+                frequencies[fields[0].lower()] = float(fields[1])
+    return frequencies
+
+
+class CompletionIndex(_MappedIndex):
+    """
+    Complétion des formes conjuguées (sans pronom) à partir de leur début.
+
+    Les formes distinctes sont triées et chacune a un rang : par fréquence décroissante si un
+    fichier de fréquences est donné, puis par ordre des temps (présent d'abord), puis par ordre
+    alphabétique. Les formes commençant par un préfixe forment un intervalle du tableau trié : il
+    est parcouru directement s'il est court (au plus `SCAN_LIMIT` formes), sinon les `top_k`
+    meilleures formes du préfixe sont lues dans une table précalculée.
+
+    Format (mêmes conventions que `FormIndex`) :
+        MAGIC, nombre de formes, nombre de préfixes précalculés, top_k, taille de l'en-tête
+        en-tête : empreinte
+        positions des formes (nombre de formes + 1) puis formes en UTF-8, triées
+        rang de chaque forme
+        positions des préfixes (nombre de préfixes + 1) puis préfixes en UTF-8, triés
+        numéros des top_k meilleures formes de chaque préfixe (NONE pour compléter)
+    """
+    MAGIC = b"CJMCMP01"
+    SCAN_LIMIT = 64
+    NONE = 0xFFFFFFFF
+
+    def __init__(self, path):
+        with open(path, "rb") as fh:
+            self._mmap = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+        view = memoryview(self._mmap)
+        if view[:8] != self.MAGIC:
+            view.release()
+            self._mmap.close()
+            raise ValueError(f"{path} n'est pas un index de complétion")
+
+        size, n_prefixes, self.top_k, header_size = view[8:24].cast("I")
+        self.fingerprint = view[24:24 + header_size].tobytes().decode()
+
+        position = 24 + self._aligned(header_size)
+        self._form_offsets, self._forms, position = self._read_strings(view, position, size)
+        self._ranks = view[position:position + 4 * size].cast("I")
+        position += 4 * size
+        self._prefix_offsets, self._prefixes, position = self._read_strings(view, position, n_prefixes)
+        self._tops = view[position:position + 4 * n_prefixes * self.top_k].cast("I")
+        self._view = view
+        self._size = size
+        self._n_prefixes = n_prefixes
+
+    @classmethod
+    def build(cls, form_index, path, frequencies=None, top_k=16, fingerprint=""):
+        """
+        Écrit dans `path` l'index de complétion des formes d'un `FormIndex`, sans reconjuguer.
+        `frequencies` est un dictionnaire {forme: fréquence} (voir `read_frequencies`).
+        """
+        from bisect import bisect_left
+
+        # Temps le plus prioritaire de chaque forme
+        best = {}
+        for i in range(len(form_index)):
+            form = form_index._form(i)
+            tense_id = form_index._tense_ids[i]
+            if tense_id < best.get(form, 256):
+                best[form] = tense_id
+
+        forms = sorted(best)
+        frequencies = {form.encode(): count for form, count in (frequencies or {}).items()}
+        order = sorted(range(len(forms)),
+                       key=lambda i: (-frequencies.get(forms[i], 0), best[forms[i]], forms[i]))
+        ranks = array("I", bytes(4 * len(forms)))
+        for rank, i in enumerate(order):
+            ranks[i] = rank
+
+        # Préfixes dont l'intervalle est trop long pour être parcouru à chaque requête
+        prefixes = []
+        pending = [(b"", 0, len(forms))]
+        while pending:
+            prefix, lo, hi = pending.pop()
+            if hi - lo <= cls.SCAN_LIMIT:
+                continue
+
+            top = heapq.nsmallest(top_k, range(lo, hi), key=ranks.__getitem__)
+            prefixes.append((prefix, top + [cls.NONE] * (top_k - len(top))))
+
+            depth = len(prefix)
+            i = lo + (len(forms[lo]) == depth)
+            while i < hi:
+                child = forms[i][:depth + 1]
+                j = bisect_left(forms, child + b"\xff", i, hi)
+                pending.append((child, i, j))
+                i = j
+        prefixes.sort()
+
+        header = fingerprint.encode()
+        with cls._replacing(path) as fh:
+            fh.write(cls.MAGIC)
+            array("I", [len(forms), len(prefixes), top_k, len(header)]).tofile(fh)
+            fh.write(cls._pad(header))
+            cls._write_strings(fh, forms)
+            ranks.tofile(fh)
+            cls._write_strings(fh, [prefix for prefix, _ in prefixes])
+            array("I", [i for _, top in prefixes for i in top]).tofile(fh)
+
+    def complete(self, prefix, limit=10):
+        """
+        Retourne au plus `limit` formes commençant par `prefix`, les mieux classées d'abord.
+        `limit` ne peut pas dépasser `top_k`, le nombre de formes précalculées par préfixe.
+        """
+        if limit > self.top_k:
+            raise ValueError(f"au plus {self.top_k} propositions par requête ({limit} demandées)")
+
+        key = prefix.strip().lower().encode()
+        lo = self._bisect_strings(self._form_offsets, self._forms, key, 0, self._size)
+        # Aucun caractère UTF-8 ne contient l'octet 0xff : toutes les formes qui commencent par
+        # `key` sont strictement inférieures à key + 0xff
+        hi = self._bisect_strings(self._form_offsets, self._forms, key + b"\xff", lo, self._size)
+
+        if hi - lo > self.SCAN_LIMIT:
+            j = self._bisect_strings(self._prefix_offsets, self._prefixes, key, 0, self._n_prefixes)
+            if j < self._n_prefixes and self._string(self._prefix_offsets, self._prefixes, j) == key:
+                ids = [i for i in self._tops[j * self.top_k:j * self.top_k + limit] if i != self.NONE]
+                return [self._string(self._form_offsets, self._forms, i).decode() for i in ids]
+
+        ids = heapq.nsmallest(limit, range(lo, hi), key=self._ranks.__getitem__)
+        return [self._string(self._form_offsets, self._forms, i).decode() for i in ids]
+
+    def close(self):
+        for view in (self._form_offsets, self._forms, self._ranks, self._prefix_offsets,
+                     self._prefixes, self._tops, self._view):
+            view.release()
+        self._mmap.close()
+
+    def __len__(self):
+        return self._size
+
+
+_completion_indexes = {}
+
+
+def _default_completion_index(frequencies_path=None):
+    """
+    Ouvre l'index de complétion de la liste de verbes fournie avec le module, (re)construit à
+    partir de l'index des formes s'il est absent ou périmé. Avec un fichier de fréquences, l'index
+    classé par fréquence est écrit à côté de ce fichier (`frequencies_path + ".completion"`).
+    """
+    if frequencies_path not in _completion_indexes:
+        form_index = _default_form_index()
+        if frequencies_path is None:
+            path, fingerprint = COMPLETION_INDEX_PATH, form_index.fingerprint
+        else:
+            path = frequencies_path + ".completion"
+            fingerprint = f"{form_index.fingerprint}-{_file_crc(frequencies_path)}"
+
+        def build(path):
+            frequencies = read_frequencies(frequencies_path) if frequencies_path else None
+            CompletionIndex.build(form_index, path, frequencies, fingerprint=fingerprint)
+
+        _completion_indexes[frequencies_path] = _open_index(CompletionIndex, path, fingerprint, build)
+
+    return _completion_indexes[frequencies_path]
+
+
+def complete(prefix, limit=10, index=None):
+    """
+    Propose les formes conjuguées (sans pronom) qui commencent par `prefix`.
+
+    Parameters
+    ----------
+    prefix : string
+        début de forme tapé, par exemple "mangi"
+    limit : int
+        nombre maximal de propositions, 10 par défaut, au plus `top_k` de l'index (16)
+    index : CompletionIndex
+        index à interroger, par défaut celui de la liste de verbes fournie avec le module (classé
+        par temps, sans fréquences)
+
+    Returns
+    -------
+    list
+        formes, les mieux classées d'abord
+    """
+    return (index if index is not None else _default_completion_index()).complete(prefix, limit)
+
+
+class ConjugationStore(_MappedIndex):
+    """
+    Conjugaisons précalculées des verbes d'une liste, à tous les temps.
+
+    Le fichier est projeté en mémoire avec mmap en lecture seule : plusieurs processus qui ouvrent
+    le même fichier (ou l'héritent d'un fork) en partagent les pages, sans copie. Un verbe est
+    retrouvé par une table de hachage ouverte (crc32 de l'infinitif, sondage linéaire) puis ses
+    formes sont lues à une position calculée, sans recherche de terminaison ni `Tense.conjugate`.
+    Les verbes absents du fichier sont conjugués par les règles.
+
+    Format (mêmes conventions que `FormIndex`) :
+        MAGIC, nombre de verbes, nombre de temps, nombre d'emplacements, taille de l'en-tête
+        en-tête : empreinte puis noms des temps, séparés par des retours à la ligne
+        positions des verbes (nombre de verbes + 1) puis verbes en UTF-8
+        emplacements de la table de hachage : numéro de verbe, ou NONE si libre
+        positions des conjugaisons (nombre de verbes * nombre de temps + 1) puis conjugaisons :
+        pour chaque verbe et chaque temps, les formes des personnes séparées par SEPARATOR,
+        MISSING pour une forme inexistante
+    """
+    MAGIC = b"CJMCNJ01"
+    NONE = 0xFFFFFFFF
+    SEPARATOR = "\n"
+    MISSING = "\0"
+
+    def __init__(self, path):
+        with open(path, "rb") as fh:
+            self._mmap = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+        view = memoryview(self._mmap)
+        try:
+            if view[:8] != self.MAGIC:
+                raise ValueError(f"{path} n'est pas un fichier de conjugaisons précalculées")
+
+            n_verbs, n_tenses, n_slots, header_size = view[8:24].cast("I")
+            header = view[24:24 + header_size].tobytes().decode().split("\n")
+            self.fingerprint = header[0]
+            self.tenses = self._read_tenses(path, header[1:])
+        except ValueError:
+            view.release()
+            self._mmap.close()
+            raise
+        self._columns = {tense: i for i, tense in enumerate(self.tenses)}
+
+        # Les chaînes sont lues par tranches du mmap (des bytes), plus rapides que des memoryview
+        position = 24 + self._aligned(header_size)
+        self._verb_offsets, self._verbs, position = self._read_strings(view, position, n_verbs)
+        self._verbs_start = position - self._aligned(len(self._verbs))
+        self._slots = view[position:position + 4 * n_slots].cast("I")
+        position += 4 * n_slots
+        self._cell_offsets, self._cells, position = self._read_strings(view, position, n_verbs * n_tenses)
+        self._cells_start = position - self._aligned(len(self._cells))
+        self._view = view
+        self._size = n_verbs
+        self._mask = n_slots - 1
+        self._last = (None, None)
+
+    @classmethod
+    def build(cls, verbs, path, tenses=None, fingerprint=""):
+        """
+        Conjugue les verbes à tous les temps donnés (tous les temps de `TENSES`, facultatifs
+        compris, par défaut) et écrit leurs formes dans `path`.
+        """
+        tenses = tuple((TENSES.resolve(name) for name in TENSES.names()) if tenses is None else tenses)
+        verbs = list(dict.fromkeys(verbs))
+
+        cells = []
+        for verb in verbs:
+            for tense, suffix in zip(tenses, classify(verb, tenses)):
+                forms = (None,) * len(tense.PRONOUNS) if suffix is None else tense._forms(verb, suffix)
+                cells.append(cls.SEPARATOR.join(cls.MISSING if form is None else form
+                                                for form in forms).encode())
+
+        # Au moins deux fois plus d'emplacements que de verbes : les sondages restent courts
+        n_slots = 1
+        while n_slots < 2 * len(verbs):
+            n_slots *= 2
+        slots = array("I", [cls.NONE]) * n_slots
+        for verb_id, verb in enumerate(verbs):
+            slot = zlib.crc32(verb.encode()) & (n_slots - 1)
+            while slots[slot] != cls.NONE:
+                slot = (slot + 1) & (n_slots - 1)
+            slots[slot] = verb_id
+
+        header = "\n".join([fingerprint] + [tense.__name__ for tense in tenses]).encode()
+        with cls._replacing(path) as fh:
+            fh.write(cls.MAGIC)
+            array("I", [len(verbs), len(tenses), n_slots, len(header)]).tofile(fh)
+            fh.write(cls._pad(header))
+            cls._write_strings(fh, [verb.encode() for verb in verbs])
+            slots.tofile(fh)
+            cls._write_strings(fh, cells)
+
+    def forms(self, verb, tense):
+        """
+        Retourne les formes (sans pronom, None si inexistante) de chaque personne du verbe au temps
+        donné, comme `ConjugationTable.forms`, ou None si le verbe ou le temps n'est pas précalculé.
+        """
+        column = self._columns.get(tense)
+        verb_id = self._find(verb)
+        if column is None or verb_id is None:
+            return None
+
+        i = verb_id * len(self.tenses) + column
+        start = self._cells_start
+        cell = self._mmap[start + self._cell_offsets[i]:start + self._cell_offsets[i + 1]]
+        forms = cell.decode().split(self.SEPARATOR)
+        if self.MISSING in forms:
+            return tuple(None if form == self.MISSING else form for form in forms)
+        return tuple(forms)
+
+    def conjugate(self, verb, tense, interrogative=False):
+        """Conjugue un verbe comme `conjugate()`, en lisant ses formes si elles sont précalculées"""
+        forms = self.forms(verb, tense)
+        if forms is None:
+            return conjugate(verb, tense, interrogative)
+        return ConjugationTable(tense, forms, interrogative)
+
+    def _find(self, verb):
+        """Numéro du verbe dans le fichier, None s'il n'y est pas"""
+        # Un même verbe est souvent demandé à plusieurs temps de suite
+        last_verb, last_id = self._last
+        if verb == last_verb:
+            return last_id
+
+        key = verb.encode()
+        slot = zlib.crc32(key) & self._mask
+        while (verb_id := self._slots[slot]) != self.NONE:
+            start = self._verbs_start
+            if self._mmap[start + self._verb_offsets[verb_id]:start + self._verb_offsets[verb_id + 1]] == key:
+                break
+            slot = (slot + 1) & self._mask
+        else:
+            verb_id = None
+
+        self._last = (verb, verb_id)
+        return verb_id
+
+    def close(self):
+        for view in (self._verb_offsets, self._verbs, self._slots, self._cell_offsets, self._cells,
+                     self._view):
+            view.release()
+        self._mmap.close()
+
+    def is_current(self):
+        """Le fichier a-t-il été construit par ce code source (et cette version de Python) ?"""
+        return self.fingerprint.startswith(_source_fingerprint() + "-")
+
+    def __contains__(self, verb):
+        return self._find(verb) is not None
+
+    def __len__(self):
+        return self._size
+
+
+_conjugation_store = None
+
+
+def _default_conjugation_store():
+    """
+    Ouvre les conjugaisons précalculées de la liste de verbes fournie avec le module, (re)construites
+    si elles sont absentes ou si le module ou la liste de verbes ont changé depuis.
+    """
+    global _conjugation_store
+
+    if _conjugation_store is None:
+        fingerprint = f"{_source_fingerprint()}-{_file_crc(VERBS_PATH)}"
+        _conjugation_store = _open_index(ConjugationStore, CONJUGATION_STORE_PATH, fingerprint,
+                                         lambda path: ConjugationStore.build(read_verbs(VERBS_PATH), path,
+                                                                             fingerprint=fingerprint))
+
+    return _conjugation_store
+
+
+def lookup(verb, tense, interrogative=False, store=None):
+    """
+    Conjugue un verbe comme `conjugate()`, en lisant ses formes dans des conjugaisons précalculées.
+
+    Parameters
+    ----------
+    verb : string
+        verbe à conjuguer, conjugué par les règles s'il est absent des conjugaisons précalculées
+    tense : Tense
+        temps à utiliser
+    interrogative : bool
+        utiliser la forme interrogative ? False par défaut
+    store : ConjugationStore
+        conjugaisons à lire, par défaut celles de la liste de verbes fournie avec le module
+        (construites au premier appel dans `conjugue_moi.store`)
+    """
+    return (store if store is not None else _default_conjugation_store()).conjugate(verb, tense, interrogative)
+
+
+def dictionary_forms(verb, tenses=None):
+    """
+    Génère les formes d'un verbe telles qu'écrites dans le dictionnaire : pour chaque temps, les
+    formes simples puis les formes interrogatives.
+    """
+    tenses = tuple(TENSES.values() if tenses is None else tenses)
+
+    stats = _instrumentation
+    if stats is None:
+        for tense, suffix in zip(tenses, classify(verb, tenses)):
+            if suffix is None:
+                continue
+            simple, interrogative = tense._render_both(verb, suffix)
+            yield from simple
+            yield from interrogative
+        return
+
+    start = perf_counter()
+    suffixes = classify(verb, tenses)
+    stats.record_classify(perf_counter() - start)
+
+    for tense, suffix in zip(tenses, suffixes):
+        start = perf_counter()
+        simple, interrogative = tense._render_both(verb, suffix) if suffix is not None else ((), ())
+        stats.record(tense, suffix, perf_counter() - start)
+        yield from simple
+        yield from interrogative
+
+
+def dictionary_rows(verb, tenses=None):
+    """
+    Même parcours que `dictionary_forms`, sous forme de tuples
+    (infinitif, temps, personne, pronom, verbe conjugué seul, forme interrogative ?).
+    """
+    tenses = tuple(TENSES.values() if tenses is None else tenses)
+    stats = _instrumentation
+
+    if stats is not None:
+        start = perf_counter()
+    suffixes = classify(verb, tenses)
+    if stats is not None:
+        stats.record_classify(perf_counter() - start)
+
+    for tense, suffix in zip(tenses, suffixes):
+        if stats is not None:
+            start = perf_counter()
+            rows = [] if suffix is None else [
+                (verb, tense.__name__, person, pronoun, form, interrogative)
+                for interrogative in (False, True)
+                for person, pronoun, form in tense._iter_inflections(verb, suffix, interrogative)]
+            stats.record(tense, suffix, perf_counter() - start)
+            yield from rows
+            continue
+
+        if suffix is None:
+            continue
+        for interrogative in (False, True):
+            for person, pronoun, form in tense._iter_inflections(verb, suffix, interrogative):
+                yield verb, tense.__name__, person, pronoun, form, interrogative
+
+
+class PlainFormat:
+    """Format historique : une forme conjuguée par ligne, pronom compris"""
+    header = ""
+
+    @staticmethod
+    def render(verbs, tenses):
+        return "".join(form + "\n" for verb in verbs for form in dictionary_forms(verb, tenses))
+
+
+class TsvFormat:
+    """Une ligne par forme, colonnes séparées par des tabulations"""
+    header = "infinitive\ttense\tperson\tpronoun\tform\tinterrogative\n"
+
+    @staticmethod
+    def render(verbs, tenses):
+        return "".join(f"{verb}\t{tense}\t{person}\t{pronoun}\t{form}\t{interrogative:d}\n"
+                       for verb in verbs
+                       for verb, tense, person, pronoun, form, interrogative
+                       in dictionary_rows(verb, tenses))
+
+
+class JsonLinesFormat:
+    """Un objet JSON par forme et par ligne"""
+    header = ""
+
+    @staticmethod
+    def render(verbs, tenses):
+        import json
+
+        return "".join(json.dumps({"infinitive": verb, "tense": tense, "person": person,
+                                   "pronoun": pronoun, "form": form,
+                                   "interrogative": interrogative}, ensure_ascii=False) + "\n"
+                       for verb in verbs
+                       for verb, tense, person, pronoun, form, interrogative
+                       in dictionary_rows(verb, tenses))
+
+
+# Formats de sortie du dictionnaire, un nouveau format n'a qu'à fournir `header` et `render`
+OUTPUT_FORMATS = {"plain": PlainFormat,
+                  "tsv": TsvFormat,
+                  "jsonl": JsonLinesFormat}
+
+
+class BlockWriter:
+    """
+    Accumule le texte à écrire et ne le transmet au flux que par blocs d'au moins `block_size`
+    caractères, pour limiter le nombre d'écritures.
+    """
+
+    def __init__(self, stream, block_size=1 << 20):
+        self.stream = stream
+        self.block_size = block_size
+        self._parts = []
+        self._size = 0
+
+    def write(self, text):
+        self._parts.append(text)
+        self._size += len(text)
+        if self._size >= self.block_size:
+            self.flush()
+
+    def flush(self):
+        if self._parts:
+            self.stream.write("".join(self._parts))
+            self._parts = []
+            self._size = 0
+        self.stream.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.flush()
+
+
+def _dictionary_chunk(verbs, tenses, fmt="plain", instrumented=False):
+    """
+    Retourne le texte du dictionnaire d'un lot de verbes dans le format demandé.
+    Avec `instrumented`, retourne le couple (texte, rapport des statistiques du lot) : utilisé par
+    les processus fils, dont les statistiques ne sont pas visibles du processus principal.
+    """
+    if not instrumented:
+        return OUTPUT_FORMATS[fmt].render(verbs, tenses)
+
+    enable_instrumentation()
+    try:
+        return OUTPUT_FORMATS[fmt].render(verbs, tenses), _instrumentation.report()
+    finally:
+        disable_instrumentation()
+
+
+def _chunked(iterable, size):
+    """Découpe un itérable en listes d'au plus `size` éléments"""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def generate_dictionary(lines, output, tenses=None, jobs=1, chunk_size=256, fmt="plain"):
+    """
+    Écrit le dictionnaire des verbes conjugués à partir des lignes d'une liste de verbes.
+
+    Parameters
+    ----------
+    lines : iterable
+        lignes de la liste de verbes, un verbe par ligne
+    output : file
+        flux de sortie texte
+    tenses : iterable
+        temps à utiliser, tous les temps de `TENSES` par défaut
+    jobs : int
+        nombre de processus de conjugaison, 1 par défaut (pas de processus fils)
+    chunk_size : int
+        nombre de verbes confiés à un processus à la fois
+    fmt : string
+        format de sortie, une clé de `OUTPUT_FORMATS` ("plain" par défaut)
+    """
+    tenses = tuple(TENSES.values() if tenses is None else tenses)
+    verbs = (line[:-1].lower() for line in lines)
+    chunks = _chunked(verbs, chunk_size)
+
+    with BlockWriter(output) as writer:
+        writer.write(OUTPUT_FORMATS[fmt].header)
+
+        if jobs <= 1:
+            for chunk in chunks:
+                writer.write(_dictionary_chunk(chunk, tenses, fmt))
+            return
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        stats = _instrumentation
+
+        def write(future):
+            if stats is None:
+                writer.write(future.result())
+            else:
+                text, report = future.result()
+                stats.merge(report)
+                writer.write(text)
+
+        # Les lots sont écrits dans l'ordre de soumission. Le nombre de lots en vol est borné pour
+        # que la mémoire utilisée ne dépende pas de la taille du fichier d'entrée.
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            pending = deque()
+            for chunk in chunks:
+                pending.append(pool.submit(_dictionary_chunk, chunk, tenses, fmt, stats is not None))
+                if len(pending) >= 2 * jobs:
+                    write(pending.popleft())
+
+            while pending:
+                write(pending.popleft())
+
+
+def shard_lines(lines, shard, shards):
+    """
+    Retourne la tranche numéro `shard` (de 1 à `shards`) des lignes d'une liste de verbes.
+    Les tranches sont contiguës et découpées selon le numéro de ligne : la concaténation des
+    dictionnaires des tranches, dans l'ordre, est le dictionnaire de la liste entière.
+    """
+    if not 1 <= shard <= shards:
+        raise ValueError(f"tranche {shard}/{shards} invalide")
+
+    lines = list(lines)
+    return lines[len(lines) * (shard - 1) // shards:len(lines) * shard // shards]
+
+
+def _detect_format(path):
+    """Format de `OUTPUT_FORMATS` dont l'en-tête commence le fichier, None si aucun ne convient"""
+    headers = {name: fmt.header.encode() for name, fmt in OUTPUT_FORMATS.items() if fmt.header}
+    with open(path, "rb") as fh:
+        start = fh.read(max(map(len, headers.values()), default=0))
+    for name, header in headers.items():
+        if start.startswith(header):
+            return name
+    return None
+
+
+def check_shards(paths, fmt=None):
+    """
+    Vérifie, avant toute écriture, que les tranches `paths` sont lisibles et au même format, et
+    retourne ce format. Sans `fmt`, le format est celui dont l'en-tête commence la première
+    tranche ("plain" si aucun) ; une tranche qui commence par l'en-tête d'un autre format, ou à
+    laquelle manque l'en-tête du format, est refusée (ValueError).
+    """
+    for path in paths:
+        detected = _detect_format(path)
+        if fmt is None:
+            fmt = detected or "plain"
+        if detected not in (None, fmt):
+            raise ValueError(f"{path} : tranche au format {detected}, format {fmt} attendu")
+
+        header = OUTPUT_FORMATS[fmt].header.encode()
+        with open(path, "rb") as fh:
+            if fh.read(len(header)) != header:
+                raise ValueError(f"{path} : en-tête du format {fmt} absent")
+    return fmt
+
+
+def merge_shards(paths, output, fmt=None):
+    """
+    Réassemble les dictionnaires des tranches `paths`, données dans l'ordre des tranches, dans le
+    flux binaire `output`. L'en-tête du format n'est gardé qu'une fois. Les tranches sont d'abord
+    vérifiées par `check_shards` : rien n'est écrit si l'une d'elles est refusée.
+    """
+    import shutil
+
+    header = OUTPUT_FORMATS[check_shards(paths, fmt)].header.encode()
+    output.write(header)
+    for path in paths:
+        with open(path, "rb") as fh:
+            fh.seek(len(header))
+            shutil.copyfileobj(fh, output, 1 << 20)
+
+
+def format_table(verb, tenses=None):
+    """
+    Retourne le tableau de conjugaison Markdown d'un verbe, une colonne par temps.
+    `tenses` est un registre {nom d'affichage: temps}, `TENSES` par défaut.
+    """
+    tenses = TENSES if tenses is None else tenses
+    header = "|"
+    output = ["|"] * 6
+
+    for tense_name, tense in tenses.items():
+        header += f" {tense_name:20} |"
+        conjug = conjugate(verb, tense)
+
+        for i, person in enumerate(["1ps", "2ps", "3ps", "1pp", "2pp", "3pp"]):
+            try:
+                for result in conjug[person].values():
+                    if result:
+                        output[i] += f" {result:20} |"
+                    else:
+                        output[i] += " " * 20 + "  |"
+                    break
+            except KeyError:
+                output[i] += " " * 20 + "  |"
+
+    separator = ("| " + "-" * 20 + " ") * len(tenses) + "|"
+    return "\n".join([header, separator] + output) + "\n"
+
+
+def serve_stream(lines, output, tenses=None, fmt="table"):
+    """
+    Répond aux requêtes lues ligne par ligne, pour servir de coprocessus : le processus et ses
+    tables restent chauds d'une requête à l'autre.
+
+    Une requête est un verbe seul, ou un objet JSON
+    {"verb": "manger", "tenses": ["Présent", "Futur"], "format": "table"}
+    dont `tenses` et `format` sont facultatifs. La réponse (tableau Markdown pour le format
+    "table", lignes du dictionnaire pour un format de `OUTPUT_FORMATS`, sans en-tête) se termine
+    par une ligne vide et le flux est vidé après chaque réponse. Une requête invalide reçoit
+    une ligne "erreur : ..." suivie de la ligne vide.
+
+    Parameters
+    ----------
+    lines : iterable
+        lignes de requêtes, par exemple l'entrée standard
+    output : file
+        flux de sortie texte
+    tenses : TenseRegistry
+        temps à utiliser quand la requête n'en donne pas, `TENSES` par défaut
+    fmt : string
+        format utilisé quand la requête n'en donne pas, "table" ou une clé de `OUTPUT_FORMATS`
+    """
+    import json
+
+    tenses = TENSES if tenses is None else tenses
+
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            if line.startswith("{"):
+                request = json.loads(line)
+                verb = request["verb"].lower()
+                request_tenses = TENSES.select(request["tenses"]) if "tenses" in request else tenses
+                request_fmt = request.get("format", fmt)
+                if request_fmt != "table" and request_fmt not in OUTPUT_FORMATS:
+                    raise ValueError(f"format inconnu : {request_fmt}")
+            else:
+                verb, request_tenses, request_fmt = line.lower(), tenses, fmt
+        except (ValueError, KeyError, TypeError, AttributeError) as error:
+            output.write(f"erreur : requête invalide : {error!r}\n\n")
+            output.flush()
+            continue
+
+        if request_fmt == "table":
+            output.write(format_table(verb, request_tenses) + "\n")
+        else:
+            output.write(OUTPUT_FORMATS[request_fmt].render([verb], tuple(request_tenses.values())) + "\n")
+        output.flush()
+
+
+def rules_fingerprint(tenses=None, fmt="plain"):
+    """
+    Empreinte des tables de terminaisons et des pronoms des temps utilisés, du format de sortie
+    et du code source du module (qui construit les formes à partir des tables)
+    """
+    tenses = tuple(TENSES.values() if tenses is None else tenses)
+    rules = [(tense.__name__, tense.PRONOUNS, tense._rules()) for tense in tenses]
+    return f"{zlib.crc32(repr((rules, fmt)).encode()):08x}-{_source_fingerprint()}"
+
+
+def update_dictionary(lines, path, tenses=None, fmt="plain"):
+    """
+    Met à jour un dictionnaire déjà généré dans le fichier `path` sans reconjuguer les verbes qu'il
+    contient déjà.
+
+    Un manifeste `path + ".manifest"` enregistre la position, la taille et l'empreinte du bloc de
+    chaque verbe, ainsi que l'empreinte des tables de terminaisons. Seuls les verbes nouveaux, ou
+    dont le bloc ne correspond plus à son empreinte, sont conjugués ; les autres blocs sont recopiés
+    depuis l'ancien fichier, dans l'ordre de la nouvelle liste. Le dictionnaire est entièrement
+    regénéré si le manifeste manque ou si les tables, le format ou le code du module ont changé.
+
+    Parameters
+    ----------
+    lines : iterable
+        lignes de la liste de verbes, un verbe par ligne
+    path : string
+        fichier du dictionnaire à mettre à jour ou à créer
+    tenses : iterable
+        temps à utiliser, tous les temps de `TENSES` par défaut
+    fmt : string
+        format de sortie, une clé de `OUTPUT_FORMATS` ("plain" par défaut)
+
+    Returns
+    -------
+    dict
+        nombre de blocs recopiés ("reused") et conjugués ("generated"), et "rebuilt" si tout le
+        dictionnaire a été regénéré
+    """
+    import json
+
+    tenses = tuple(TENSES.values() if tenses is None else tenses)
+    manifest_path = path + ".manifest"
+    rules = rules_fingerprint(tenses, fmt)
+
+    try:
+        with open(manifest_path) as fh:
+            manifest = json.load(fh)
+        old = open(path, "rb")
+    except (OSError, ValueError):
+        manifest, old = None, None
+    # Un manifeste d'une autre forme que celle écrite ici est traité comme absent
+    if manifest is not None and not (isinstance(manifest, dict) and manifest.get("rules") == rules
+                                     and isinstance(manifest.get("verbs"), dict)):
+        old.close()
+        manifest, old = None, None
+    blocks = manifest["verbs"] if manifest is not None else {}
+
+    header = OUTPUT_FORMATS[fmt].header.encode()
+    entries = {}
+    counts = {"reused": 0, "generated": 0, "rebuilt": manifest is None}
+
+    try:
+        with open(path + ".tmp", "wb") as out:
+            out.write(header)
+            position = len(header)
+
+            for line in lines:
+                verb = line[:-1].lower()
+
+                block = None
+                if verb in blocks:
+                    offset, size, crc = blocks[verb]
+                    old.seek(offset)
+                    block = old.read(size)
+                    if len(block) != size or zlib.crc32(block) != crc:
+                        block = None
+
+                if block is None:
+                    block = _dictionary_chunk([verb], tenses, fmt).encode()
+                    counts["generated"] += 1
+                else:
+                    counts["reused"] += 1
+
+                out.write(block)
+                entries[verb] = [position, len(block), zlib.crc32(block)]
+                position += len(block)
+    finally:
+        if old is not None:
+            old.close()
+
+    os.replace(path + ".tmp", path)
+    with open(manifest_path + ".tmp", "w") as fh:
+        json.dump({"rules": rules, "format": fmt, "verbs": entries}, fh, ensure_ascii=False)
+    os.replace(manifest_path + ".tmp", manifest_path)
+
+    return counts
+
+
+# Drapeau Hunspell des infinitifs : valides seulement avec un suffixe (l'infinitif n'est pas une forme
+# conjuguée du dictionnaire)
+HUNSPELL_NEEDAFFIX = 1
+
+
+def _hunspell_rule(verb, suffix, form):
+    """
+    Règle de suffixe (retrait, ajout) qui produit la forme à partir de l'infinitif, en retirant au
+    moins la terminaison. Retourne None si la règle devrait retirer tout l'infinitif, ce que
+    Hunspell n'accepte pas.
+    """
+    limit = len(verb) - len(suffix)
+    common = 0
+    while common < limit and common < len(form) and verb[common] == form[common]:
+        common += 1
+    if common == 0:
+        return None
+    return verb[common:], form[common:]
+
+
+def hunspell_affixes(lines, tenses=None):
+    """
+    Calcule un dictionnaire Hunspell compressé par affixes, équivalent au dictionnaire généré.
+
+    Chaque paradigme (temps, terminaison) reçoit un drapeau, dont les règles de suffixe produisent
+    les formes conjuguées seules (colonne "form" du format tsv, formes simples et interrogatives)
+    de tous les verbes qui le portent. Hunspell vérifie les mots un par un : les pronoms sont des
+    mots du dictionnaire français, ils ne sont pas répétés ici.
+
+    Une règle n'est jamais plus générale que ce que produit le moteur : si elle donnerait une forme
+    fausse pour un autre verbe du même paradigme (changements de radical "è.é-je"), sa condition est
+    allongée jusqu'à exclure ce verbe. Les formes qui ne s'expriment pas en suffixe (radical vide)
+    sont listées telles quelles dans le .dic.
+
+    Parameters
+    ----------
+    lines : iterable
+        lignes de la liste de verbes, un verbe par ligne
+    tenses : iterable
+        temps à utiliser, tous les temps de `TENSES` par défaut
+
+    Returns
+    -------
+    tuple
+        (règles, entrées) : règles {drapeau: [(retrait, ajout, condition), ...]} et entrées
+        [(mot, [drapeaux]), ...] du .dic
+    """
+    tenses = tuple(TENSES.values() if tenses is None else tenses)
+    if any(issubclass(tense, CompoundTense) for tense in tenses):
+        raise ValueError("les temps composés ne s'écrivent pas en un seul mot Hunspell")
+
+    # Formes de chaque verbe pour chaque paradigme, dans l'ordre d'apparition des paradigmes
+    paradigms = {}
+    entries = {}
+    for line in lines:
+        verb = line[:-1].lower()
+        flags = entries.setdefault(verb, [])
+        for tense, suffix in zip(tenses, classify(verb, tenses)):
+            if suffix is None:
+                continue
+            verbs = paradigms.setdefault((tense, suffix), {})
+            if verb not in verbs:
+                verbs[verb] = {form for interrogative in (False, True)
+                               for _, _, form in tense._iter_inflections(verb, suffix, interrogative)}
+                flags.append((tense, suffix))
+
+    rules = {}
+    words = {}  # formes écrites telles quelles dans le .dic, dans l'ordre d'apparition
+    for flag, ((tense, suffix), verbs) in enumerate(paradigms.items(), HUNSPELL_NEEDAFFIX + 1):
+        needed = {}
+        for verb, forms in verbs.items():
+            for form in sorted(forms):
+                rule = _hunspell_rule(verb, suffix, form)
+                if rule is None:
+                    words[form] = None
+                else:
+                    needed.setdefault(rule, []).append(verb)
+
+        flag_rules = rules[flag] = []
+        for (strip, add), producers in needed.items():
+            # Verbes du paradigme auxquels la règle s'appliquerait à tort
+            wrong = [verb for verb, forms in verbs.items()
+                     if verb.endswith(strip) and len(verb) > len(strip)
+                     and verb[:len(verb) - len(strip)] + add not in forms]
+
+            if not wrong:
+                flag_rules.append((strip, add, strip or "."))
+                continue
+
+            conditions = set()
+            for verb in producers:
+                for size in range(len(strip) + 1, len(verb) + 1):
+                    condition = verb[-size:]
+                    if any(other.endswith(condition) for other in wrong):
+                        continue
+                    if not any(condition.endswith(known) for known in conditions):
+                        conditions.add(condition)
+                    break
+                else:
+                    words[verb[:len(verb) - len(strip)] + add] = None
+            flag_rules.extend((strip, add, condition) for condition in sorted(conditions))
+
+    # Les infinitifs suivent les mots isolés : un même mot peut être les deux
+    flag_of = {paradigm: flag for flag, paradigm in enumerate(paradigms, HUNSPELL_NEEDAFFIX + 1)}
+    entries = [(verb, [HUNSPELL_NEEDAFFIX] + [flag_of[paradigm] for paradigm in verb_paradigms])
+               for verb, verb_paradigms in entries.items() if verb_paradigms]
+    return rules, [(word, []) for word in words] + entries
+
+
+def write_hunspell(lines, basename, tenses=None):
+    """
+    Écrit les fichiers Hunspell `basename + ".aff"` et `basename + ".dic"` calculés par
+    `hunspell_affixes`. Retourne le nombre de drapeaux, de règles et d'entrées du .dic.
+    """
+    rules, words = hunspell_affixes(lines, tenses)
+
+    with open(basename + ".aff", "w") as fh:
+        fh.write("SET UTF-8\nFLAG num\n")
+        fh.write(f"NEEDAFFIX {HUNSPELL_NEEDAFFIX}\n")
+        for flag, flag_rules in rules.items():
+            fh.write(f"\nSFX {flag} N {len(flag_rules)}\n")
+            for strip, add, condition in flag_rules:
+                fh.write(f"SFX {flag} {strip or 0} {add or 0} {condition}\n")
+
+    with open(basename + ".dic", "w") as fh:
+        fh.write(f"{len(words)}\n")
+        for word, flags in words:
+            fh.write(f"{word}/{','.join(map(str, flags))}\n" if flags else f"{word}\n")
+
+    return {"flags": len(rules), "rules": sum(map(len, rules.values())), "words": len(words)}
+
+
+def expand_hunspell(basename):
+    """
+    Développe les fichiers écrits par `write_hunspell` et retourne l'ensemble des mots acceptés.
+    Ne comprend que ce que `write_hunspell` écrit : suffixes sans continuation, conditions littérales.
+    """
+    rules = {}
+    with open(basename + ".aff") as fh:
+        for line in fh:
+            fields = line.split()
+            if len(fields) == 5 and fields[0] == "SFX":
+                _, flag, strip, add, condition = fields
+                rules.setdefault(int(flag), []).append(("" if strip == "0" else strip,
+                                                        "" if add == "0" else add,
+                                                        "" if condition == "." else condition))
+
+    words = set()
+    with open(basename + ".dic") as fh:
+        next(fh)
+        for line in fh:
+            word, _, flags = line.rstrip("\n").partition("/")
+            flags = [int(flag) for flag in flags.split(",")] if flags else []
+            if HUNSPELL_NEEDAFFIX not in flags:
+                words.add(word)
+            for flag in flags:
+                for strip, add, condition in rules.get(flag, ()):
+                    if word.endswith(condition) and word.endswith(strip) and len(word) > len(strip):
+                        words.add(word[:len(word) - len(strip)] + add)
+    return words
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Conjugaison des verbes français")
+    parser.add_argument("verb", nargs="?",
+                        help="verbe à conjuguer, ou fichier contenant une liste de verbes")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="nombre de processus pour générer le dictionnaire (défaut: 1)")
+    parser.add_argument("-f", "--format", choices=OUTPUT_FORMATS,
+                        help="format du dictionnaire généré (défaut: plain, ou celui des tranches pour --merge)")
+    parser.add_argument("-o", "--output", help="fichier où écrire le dictionnaire (défaut: sortie standard)")
+    parser.add_argument("-t", "--tenses", type=lambda value: value.split(","),
+                        help="temps à utiliser, séparés par des virgules, parmi " + ",".join(TENSES.names())
+                             + " (défaut: " + ",".join(TENSES) + ")")
+    parser.add_argument("--hunspell", metavar="BASE",
+                        help="écrire le dictionnaire compressé par affixes dans BASE.aff et BASE.dic")
+    parser.add_argument("--paradigms", action="store_true",
+                        help="écrire en JSON les paradigmes de conjugaison de la liste de verbes")
+    parser.add_argument("--like", metavar="VERBE",
+                        help="lister les verbes de la liste qui se conjuguent comme VERBE")
+    parser.add_argument("--complete", metavar="DÉBUT",
+                        help="proposer les formes conjuguées qui commencent par DÉBUT et quitter")
+    parser.add_argument("--frequencies", metavar="FICHIER",
+                        help="classer les propositions de --complete selon ce fichier de fréquences")
+    parser.add_argument("--shard", metavar="I/N",
+                        help="ne générer que la tranche I (de 1 à N) du dictionnaire de la liste")
+    parser.add_argument("--merge", nargs="+", metavar="TRANCHE",
+                        help="réassembler dans l'ordre les dictionnaires des tranches données et quitter")
+    parser.add_argument("--stream", nargs="?", const="table", choices=["table", *OUTPUT_FORMATS],
+                        help="lire les verbes ou requêtes JSON ligne par ligne sur l'entrée standard et "
+                             "répondre au fur et à mesure, en tableau ou au format donné (défaut: table)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="ne conjuguer que les verbes absents du dictionnaire donné par --output")
+    parser.add_argument("--stats", action="store_true",
+                        help="écrire sur la sortie d'erreur les statistiques de conjugaison en JSON")
+    parser.add_argument("--build-store", action="store_true",
+                        help="précalculer les conjugaisons de la liste de verbes à tous les temps dans "
+                             f"--output (défaut: {os.path.basename(CONJUGATION_STORE_PATH)}) et quitter")
+    args = parser.parse_args()
+
+    if args.build_store:
+        verbs_path = args.verb or VERBS_PATH
+        if not os.path.isfile(verbs_path):
+            parser.error(f"--build-store attend un fichier de verbes : {verbs_path}")
+        ConjugationStore.build(read_verbs(verbs_path), args.output or CONJUGATION_STORE_PATH,
+                               fingerprint=f"{_source_fingerprint()}-{_file_crc(verbs_path)}")
+        sys.exit()
+    if args.complete is not None:
+        print("\n".join(_default_completion_index(args.frequencies).complete(args.complete)))
+        sys.exit()
+    if args.merge:
+        # Les tranches sont vérifiées avant que le fichier de sortie ne soit ouvert (et vidé)
+        try:
+            fmt = check_shards(args.merge, args.format)
+            output = open(args.output, "wb") if args.output else sys.stdout.buffer
+            try:
+                merge_shards(args.merge, output, fmt=fmt)
+            finally:
+                if output is not sys.stdout.buffer:
+                    output.close()
+        except (OSError, ValueError) as error:
+            parser.error(str(error))
+        sys.exit()
+    if args.format is None:
+        args.format = "plain"
+    if args.verb is None and not args.stream:
+        parser.error("un verbe ou un fichier de verbes est requis")
+    if args.incremental and not args.output:
+        parser.error("--incremental nécessite --output")
+    if args.shard and (args.hunspell or args.paradigms or args.like or args.stream):
+        parser.error("--shard ne s'applique qu'à la génération du dictionnaire")
+    if args.shard:
+        try:
+            shard, shards = map(int, args.shard.split("/"))
+        except ValueError:
+            shard, shards = 0, 0
+        if not 1 <= shard <= shards:
+            parser.error(f"--shard attend I/N avec 1 <= I <= N : {args.shard}")
+
+    if args.stats:
+        enable_instrumentation()
+
+    try:
+        tenses = TENSES.select(args.tenses) if args.tenses else TENSES
+    except KeyError as error:
+        parser.error(f"temps inconnu : {error.args[0]}")
+
+    arg1 = args.verb
+
+    # Requêtes sur l'entrée standard, réponses au fil de l'eau sur la sortie standard
+    if args.stream:
+        serve_stream(sys.stdin, sys.stdout, tenses, fmt=args.stream)
+
+    # Fichier en entrée, paradigmes de conjugaison en sortie
+    elif os.path.isfile(arg1) and (args.paradigms or args.like):
+        import json
+
+        index = ParadigmIndex(read_verbs(arg1), tenses.values())
+        if args.like:
+            print("\n".join(index.like(args.like.lower())))
+        else:
+            print(json.dumps(index.report(), indent=2, ensure_ascii=False))
+
+    # Fichier en entrée, dictionnaire Hunspell (.aff et .dic) en sortie
+    elif os.path.isfile(arg1) and args.hunspell:
+        with open(arg1) as fh:
+            try:
+                write_hunspell(fh, args.hunspell, tenses=tenses.values())
+            except ValueError as error:
+                parser.error(str(error))
+
+    # Fichier en entrée liste en sortie, en ne conjuguant que les nouveaux verbes
+    elif os.path.isfile(arg1) and args.incremental:
+        with open(arg1) as fh:
+            lines = shard_lines(fh, shard, shards) if args.shard else fh
+            update_dictionary(lines, args.output, tenses=tenses.values(), fmt=args.format)
+
+    # Fichier en entrée liste en sortie
+    elif os.path.isfile(arg1):
+        output = open(args.output, "w", buffering=1 << 20) if args.output else sys.stdout
+        try:
+            with open(arg1) as fh:
+                lines = shard_lines(fh, shard, shards) if args.shard else fh
+                generate_dictionary(lines, output, tenses=tenses.values(), jobs=args.jobs, fmt=args.format)
+        finally:
+            if output is not sys.stdout:
+                output.close()
+
+    # Verbe en entrée, tableau de conjugaison en sortie
+    else:
+        sys.stdout.write(format_table(arg1, tenses))
+
+    if args.stats:
+        import json
+
+        report = disable_instrumentation().report()
+        print(json.dumps({**report, "cache": CACHE.stats()}, indent=2, ensure_ascii=False), file=sys.stderr)
@@ -0,0 +1,245 @@
+#! /usr/bin/env python3
+"""
+Serveur de conjugaison asyncio (bibliothèque standard uniquement).
+
+Le processus garde les tables de terminaisons et le cache de `conjugue_moi` chauds entre les
+requêtes. Les requêtes reçues en même temps, de toutes les connexions, sont regroupées en lots
+et chaque verbe d'un lot n'est conjugué qu'une fois.
+
+Protocole : une requête JSON par ligne, une réponse JSON par ligne, dans l'ordre des requêtes
+de chaque connexion (les requêtes peuvent être envoyées sans attendre les réponses).
+
+    {"id": 1, "verb": "manger", "tenses": ["Présent", "Futur"], "interrogative": false}
+    {"id": 1, "verb": "manger", "tenses": {"Présent": {"1ps": {"je": "je mange"}, ...}, ...}}
+
+    {"op": "health"}   ->  {"status": "ok", "uptime": ...}
+    {"op": "metrics"}  ->  compteurs de requêtes, de lots et du cache
+
+    python3 server.py --port 8765
+    python3 server.py --port 8765 --store verbes.store
+    python3 server.py --port 8765 --load-test 10000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+import conjugue_moi
+
+
+class ConjugationServer:
+    """Serveur de conjugaison : lit les requêtes, les regroupe en lots et répond dans l'ordre"""
+
+    def __init__(self, max_batch=256, batch_window=0.001, store=None):
+        self.max_batch = max_batch
+        self.batch_window = batch_window
+        # Conjugaisons précalculées (`conjugue_moi.ConjugationStore`) lues avant les règles
+        self.store = store
+        self.started = time.monotonic()
+        self.metrics = {"connections": 0, "requests": 0, "errors": 0, "batches": 0,
+                        "batched_requests": 0, "distinct_conjugations": 0}
+        self._queue = None
+
+    async def serve(self, host="127.0.0.1", port=8765, unix=None):
+        """Démarre le serveur sur un port TCP ou une socket Unix et répond jusqu'à l'arrêt"""
+        self._queue = asyncio.Queue()
+        batcher = asyncio.create_task(self._batcher())
+
+        if unix:
+            server = await asyncio.start_unix_server(self._handle, path=unix)
+        else:
+            server = await asyncio.start_server(self._handle, host, port)
+
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            batcher.cancel()
+
+    async def _handle(self, reader, writer):
+        self.metrics["connections"] += 1
+
+        # Les réponses sont écrites par une tâche séparée, dans l'ordre des requêtes, pour que le
+        # client puisse envoyer plusieurs requêtes sans attendre et qu'elles partent dans un même lot
+        responses = asyncio.Queue()
+        sender = asyncio.create_task(self._send(responses, writer))
+
+        try:
+            while line := await reader.readline():
+                if line.strip():
+                    responses.put_nowait(self._dispatch(line))
+        finally:
+            responses.put_nowait(None)
+            await sender
+            writer.close()
+
+    async def _send(self, responses, writer):
+        while (response := await responses.get()) is not None:
+            writer.write(json.dumps(await response, ensure_ascii=False).encode() + b"\n")
+            if responses.empty():
+                await writer.drain()
+
+    def _dispatch(self, line):
+        """Retourne un futur qui recevra la réponse à une ligne de requête"""
+        future = asyncio.get_running_loop().create_future()
+        self.metrics["requests"] += 1
+
+        try:
+            request = json.loads(line)
+            op = request.get("op", "conjugate")
+            if op == "health":
+                future.set_result({"status": "ok", "uptime": time.monotonic() - self.started})
+            elif op == "metrics":
+                future.set_result(self.report())
+            elif op == "conjugate":
+                verb = request["verb"]
+                if not isinstance(verb, str):
+                    raise TypeError(f"le verbe doit être une chaîne : {verb!r}")
+                tenses = tuple(conjugue_moi.TENSES.resolve(name)
+                               for name in request.get("tenses", conjugue_moi.TENSES))
+                self._queue.put_nowait((future, request, verb, tenses,
+                                        bool(request.get("interrogative", False))))
+            else:
+                raise ValueError(f"opération inconnue : {op}")
+        except (ValueError, KeyError, TypeError, AttributeError) as error:
+            self.metrics["errors"] += 1
+            future.set_result({"error": f"requête invalide : {error!r}"})
+
+        return future
+
+    async def _batcher(self):
+        """Regroupe les requêtes arrivées pendant `batch_window` secondes et les traite ensemble"""
+        while True:
+            batch = [await self._queue.get()]
+            await asyncio.sleep(self.batch_window)
+            while len(batch) < self.max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            self._process(batch)
+
+    def _process(self, batch):
+        self.metrics["batches"] += 1
+        self.metrics["batched_requests"] += len(batch)
+
+        # Un même verbe demandé plusieurs fois dans le lot n'est conjugué qu'une fois
+        tables = {}
+        for future, request, verb, tenses, interrogative in batch:
+            # Une requête qui échoue reçoit une erreur sans interrompre le lot ni le `_batcher`
+            try:
+                result = {}
+                for tense in tenses:
+                    key = (verb, tense, interrogative)
+                    if key not in tables:
+                        if self.store is None:
+                            conjug = conjugue_moi.conjugate(verb, tense, interrogative)
+                        else:
+                            conjug = conjugue_moi.lookup(verb, tense, interrogative, self.store)
+                        tables[key] = {person: dict(forms) for person, forms in conjug.items()}
+                    result[conjugue_moi.TENSES.name_of(tense)] = tables[key]
+                response = {"verb": verb, "tenses": result}
+            except Exception as error:
+                self.metrics["errors"] += 1
+                response = {"error": f"échec de la conjugaison : {error!r}"}
+
+            if "id" in request:
+                response["id"] = request["id"]
+            if not future.done():
+                future.set_result(response)
+
+        self.metrics["distinct_conjugations"] += len(tables)
+
+    def report(self):
+        batches = self.metrics["batches"]
+        return {**self.metrics,
+                "uptime": time.monotonic() - self.started,
+                "mean_batch_size": self.metrics["batched_requests"] / batches if batches else 0.0,
+                "queued": self._queue.qsize() if self._queue is not None else 0,
+                "cache": conjugue_moi.CACHE.stats()}
+
+
+async def load_test(host, port, unix, requests, concurrency, verbs):
+    """
+    Client de test : `concurrency` connexions envoient en tout `requests` requêtes, une à la fois
+    par connexion. Retourne le débit et les latences observés.
+    """
+    latencies = []
+
+    async def client(count, offset):
+        if unix:
+            reader, writer = await asyncio.open_unix_connection(unix)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+
+        for i in range(count):
+            verb = verbs[(offset + i) % len(verbs)]
+            start = time.perf_counter()
+            writer.write(json.dumps({"id": i, "verb": verb}).encode() + b"\n")
+            await writer.drain()
+            await reader.readline()
+            latencies.append(time.perf_counter() - start)
+
+        writer.close()
+        await writer.wait_closed()
+
+    if requests < 1 or concurrency < 1:
+        raise ValueError("le test de charge demande au moins une requête et une connexion")
+
+    # Le reste de la division est réparti sur les premières connexions, aucune n'est vide
+    concurrency = min(concurrency, requests)
+    counts = [requests // concurrency + (i < requests % concurrency) for i in range(concurrency)]
+    offsets = [sum(counts[:i]) for i in range(concurrency)]
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(count, offset) for count, offset in zip(counts, offsets)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {"requests": len(latencies),
+            "seconds": elapsed,
+            "requests_per_s": len(latencies) / elapsed,
+            "latency_ms_median": statistics.median(latencies) * 1000,
+            "latency_ms_p99": latencies[int(len(latencies) * 0.99) - 1] * 1000}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serveur de conjugaison (JSON ligne par ligne)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="écouter sur une socket Unix plutôt qu'en TCP")
+    parser.add_argument("--max-batch", type=int, default=256, help="taille maximale d'un lot")
+    parser.add_argument("--batch-window", type=float, default=0.001,
+                        help="attente en secondes pour regrouper les requêtes (défaut: 0.001)")
+    parser.add_argument("--cache-size", type=int, default=conjugue_moi.CACHE.maxsize,
+                        help="taille du cache de conjugaisons")
+    parser.add_argument("--store", nargs="?", const=conjugue_moi.CONJUGATION_STORE_PATH, metavar="FICHIER",
+                        help="lire les conjugaisons précalculées par conjugue_moi.py --build-store "
+                             "(défaut: conjugue_moi.store) avant de recourir aux règles")
+    parser.add_argument("--load-test", type=int, metavar="N",
+                        help="ne pas servir : envoyer N requêtes à un serveur déjà lancé")
+    parser.add_argument("--concurrency", type=int, default=10, help="connexions du test de charge")
+    args = parser.parse_args()
+
+    if args.load_test is not None:
+        verbs = list(conjugue_moi.read_verbs(conjugue_moi.VERBS_PATH))
+        try:
+            report = asyncio.run(load_test(args.host, args.port, args.unix, args.load_test,
+                                           args.concurrency, verbs))
+        except ValueError as error:
+            parser.error(str(error))
+        print(json.dumps(report, indent=2))
+    else:
+        conjugue_moi.CACHE.resize(args.cache_size)
+        try:
+            store = conjugue_moi.ConjugationStore(args.store) if args.store else None
+        except (OSError, ValueError) as error:
+            parser.error(f"conjugaisons précalculées illisibles : {error}")
+        if store is not None and not store.is_current():
+            parser.error(f"{args.store} a été construit par une autre version de conjugue_moi, "
+                         "à reconstruire avec conjugue_moi.py --build-store")
+        server = ConjugationServer(args.max_batch, args.batch_window, store)
+        try:
+            asyncio.run(server.serve(args.host, args.port, args.unix))
+        except KeyboardInterrupt:
+            pass
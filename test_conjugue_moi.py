@@ -0,0 +1,91 @@
+#! /usr/bin/env python3
+"""
+Vérifie que les différents modes de génération produisent exactement la même sortie qu'une
+génération complète, sur une tranche de verbes_hunspell.list.
+
+    python3 -m unittest test_conjugue_moi
+"""
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+import conjugue_moi
+
+
+def _generate(lines, fmt="plain", jobs=1, tenses=None):
+    output = io.StringIO()
+    conjugue_moi.generate_dictionary(lines, output, tenses=tenses, jobs=jobs, chunk_size=16, fmt=fmt)
+    return output.getvalue()
+
+
+class EquivalenceTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with open(conjugue_moi.VERBS_PATH) as fh:
+            cls.lines = fh.readlines()[::40]
+        cls.verbs = [line[:-1].lower() for line in cls.lines]
+        cls.reference = _generate(cls.lines)
+        cls.directory = tempfile.mkdtemp()
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.directory)
+
+    def path(self, name):
+        return os.path.join(self.directory, name)
+
+    def test_jobs(self):
+        self.assertEqual(_generate(self.lines, jobs=2), self.reference)
+
+    def test_shard_merge(self):
+        for fmt in conjugue_moi.OUTPUT_FORMATS:
+            paths = []
+            for shard in range(1, 4):
+                paths.append(self.path(f"shard.{fmt}.{shard}"))
+                with open(paths[-1], "w") as fh:
+                    fh.write(_generate(conjugue_moi.shard_lines(self.lines, shard, 3), fmt))
+
+            merged = io.BytesIO()
+            conjugue_moi.merge_shards(paths, merged)
+            self.assertEqual(merged.getvalue().decode(), _generate(self.lines, fmt), fmt)
+
+    def test_incremental(self):
+        path = self.path("incremental.dic")
+        half = self.lines[::2]
+        counts = conjugue_moi.update_dictionary(half, path)
+        self.assertEqual(counts, {"reused": 0, "generated": len(half), "rebuilt": True})
+
+        counts = conjugue_moi.update_dictionary(self.lines, path)
+        self.assertEqual(counts["reused"], len(half))
+        with open(path) as fh:
+            self.assertEqual(fh.read(), self.reference)
+
+    def test_hunspell(self):
+        basename = self.path("hunspell")
+        conjugue_moi.write_hunspell(self.lines, basename)
+
+        # Colonne des formes (sans pronom) du dictionnaire TSV
+        tsv = _generate(self.lines, "tsv").splitlines()[1:]
+        forms = {row.split("\t")[4] for row in tsv}
+        self.assertEqual(conjugue_moi.expand_hunspell(basename), forms)
+
+    def test_store(self):
+        path = self.path("conjugaisons.store")
+        conjugue_moi.ConjugationStore.build(self.verbs, path)
+        tenses = [conjugue_moi.TENSES.resolve(name) for name in conjugue_moi.TENSES.names()]
+
+        with conjugue_moi.ConjugationStore(path) as store:
+            self.assertEqual(len(store), len(set(self.verbs)))
+            for verb in self.verbs + ["tramontir"]:
+                for tense in tenses:
+                    self.assertEqual(store.conjugate(verb, tense, True).forms,
+                                     tense.conjugate(verb, True).forms, (verb, tense.__name__))
+            self.assertNotIn("tramontir", store)
+
+
+if __name__ == "__main__":
+    unittest.main()